@@ -11,6 +11,36 @@ try:
 except ImportError:
     from string import ascii_uppercase
 
+#: Cache of the decoding tables: alphabet => {letter: value}
+#: (the table of the default alphabet is built at import time)
+_DECODE_TABLES = {ascii_uppercase: {letter: index for index, letter in enumerate(ascii_uppercase, 1)}}
+
+#: Maximum number of conversions memoized for the default alphabet
+_CACHE_MAXSIZE = 4096
+
+#: Memoized conversions for the default alphabet: value => letters
+_INT_TO_ALPHABET_CACHE = {}
+
+#: Memoized conversions for the default alphabet: letters => value
+_ALPHABET_TO_INT_CACHE = {}
+
+
+def _memoize(cache, key, result):
+    if len(cache) >= _CACHE_MAXSIZE:
+        cache.clear()
+    cache[key] = result
+    return result
+
+
+def _get_decode_table(alphabet):
+    if type(alphabet) is not str:
+        # the alphabet may be unhashable (a list of letters...): no cache
+        return {letter: index for index, letter in enumerate(alphabet, 1)}
+    table = _DECODE_TABLES.get(alphabet)
+    if table is None:
+        table = _DECODE_TABLES[alphabet] = {letter: index for index, letter in enumerate(alphabet, 1)}
+    return table
+
 
 def int_to_alphabet(value, alphabet=ascii_uppercase):
     """
@@ -47,17 +77,38 @@ def int_to_alphabet(value, alphabet=ascii_uppercase):
     :param alphabet: alphabet to use for the conversion.
     :return: string representing this "number" in the base-26.
     """
+    if alphabet is ascii_uppercase:
+        letters = _INT_TO_ALPHABET_CACHE.get(value)
+        if letters is None:
+            letters = _memoize(_INT_TO_ALPHABET_CACHE, value, _int_to_alphabet(value, alphabet))
+        return letters
+    return _int_to_alphabet(value, alphabet)
+
+
+def _int_to_alphabet(value, alphabet):
     if value == 0:
         return ""
     elif value < 0:
         raise ValueError(value)
     size = len(alphabet)
+    # fast path for 1 to 3 letters (up to "ZZZ" = 18278 with the default alphabet)
+    n = value - 1
+    if n < size:
+        return alphabet[n]
+    n -= size
+    size2 = size * size
+    if n < size2:
+        return alphabet[n // size] + alphabet[n % size]
+    n -= size2
+    if n < size2 * size:
+        return alphabet[n // size2] + alphabet[n // size % size] + alphabet[n % size]
+    # general case
     q, r = divmod(value - 1, size)
     letters = [alphabet[r]]
     while q:
         q, r = divmod(q - 1, size)
-        letters.insert(0, alphabet[r])
-    return "".join(letters)
+        letters.append(alphabet[r])
+    return "".join(letters[::-1])
 
 
 def alphabet_to_int(letters, alphabet=ascii_uppercase):
@@ -89,12 +140,21 @@ def alphabet_to_int(letters, alphabet=ascii_uppercase):
     :param alphabet: alphabet to use for the conversion.
     :return: Integer value of the "number".
     """
+    if alphabet is ascii_uppercase and type(letters) is str:
+        value = _ALPHABET_TO_INT_CACHE.get(letters)
+        if value is None:
+            value = _memoize(_ALPHABET_TO_INT_CACHE, letters, _alphabet_to_int(letters, alphabet))
+        return value
+    return _alphabet_to_int(letters, alphabet)
+
+
+def _alphabet_to_int(letters, alphabet):
+    table = _get_decode_table(alphabet)
     value = 0
     size = len(alphabet)
     try:
         for letter in letters:
-            value *= size
-            value += alphabet.index(letter) + 1
+            value = value * size + table[letter]
         return value
-    except ValueError:
+    except KeyError:
         raise ValueError(letters)
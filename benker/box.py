@@ -93,17 +93,20 @@ You can determine if two boxes intersect each other, or are disjoints:
     True
 
 """
-import collections
 import functools
 
 from benker.coord import Coord
 from benker.size import Size
 
-BoxTuple = collections.namedtuple('BoxTuple', ['min', 'max'])
+# Box is immutable: the slots are set with the base class method
+_set_attr = object.__setattr__
+
+# Coord/Size are tuple subclasses: skip the Python-level ``__new__`` of the namedtuple
+_new_tuple = tuple.__new__
 
 
 @functools.total_ordering
-class Box(BoxTuple):
+class Box(object):
     """
     A *Box* is a rectangular area defined by two coordinates:
 
@@ -120,8 +123,11 @@ class Box(BoxTuple):
         >>> box
         Box(min=Coord(x=1, y=1), max=Coord(x=5, y=3))
 
+    .. versionchanged:: 0.5.5
+       A *Box* is no longer a :class:`tuple` subclass: the coordinates
+       are stored in slots to speed up the attribute access.
     """
-    __slots__ = ()
+    __slots__ = ('min', 'max', '_min_x', '_min_y', '_max_x', '_max_y')
 
     def __new__(cls, *args):
         """
@@ -146,60 +152,140 @@ class Box(BoxTuple):
 
         :raises ValueError:
         """
-        types = tuple(map(type, args))
-        if types == (Coord, Coord):
-            min_x, min_y = args[0]
-            max_x, max_y = args[1]
-        elif types == (Coord, Size):
-            min_x, min_y = args[0]
-            max_x, max_y = args[0] + args[1] - 1
-        elif types == (Coord,):
-            min_x, min_y = args[0]
-            max_x, max_y = min_x, min_y
-        elif types == (int, int, int, int):
-            min_x, min_y, max_x, max_y = args
-        elif types == (int, int):
-            min_x, min_y = args
-            max_x, max_y = min_x, min_y
-        elif types == (cls,):
+        nargs = len(args)
+        if nargs == 1 and type(args[0]) is cls:
             # no duplicate
             return args[0]
-        else:
-            raise TypeError(repr(types))
+
+        # dispatch on the number of arguments first, then on the exact types
+        bounds = None
+        if nargs == 4:
+            min_x, min_y, max_x, max_y = args
+            if type(min_x) is int and type(min_y) is int and type(max_x) is int and type(max_y) is int:
+                bounds = args
+        elif nargs == 2:
+            arg0, arg1 = args
+            type0 = type(arg0)
+            type1 = type(arg1)
+            if type0 is int and type1 is int:
+                bounds = arg0, arg1, arg0, arg1
+            elif type0 is Coord and type1 is Coord:
+                min_x, min_y = arg0
+                max_x, max_y = arg1
+                if 0 < min_x <= max_x and 0 < min_y <= max_y:
+                    # the coordinates are reused
+                    return cls._from_coords(arg0, arg1, min_x, min_y, max_x, max_y)
+                raise ValueError(*args)
+            elif type0 is Coord and type1 is Size:
+                bounds = arg0.x, arg0.y, arg0.x + arg1.width - 1, arg0.y + arg1.height - 1
+        elif nargs == 1:
+            arg0 = args[0]
+            if type(arg0) is Coord:
+                bounds = arg0.x, arg0.y, arg0.x, arg0.y
+        if bounds is None:
+            raise TypeError(repr(tuple(map(type, args))))
+        min_x, min_y, max_x, max_y = bounds
         if 0 < min_x <= max_x and 0 < min_y <= max_y:
-            min_coord = Coord(min_x, min_y)
-            max_coord = Coord(max_x, max_y)
-            # noinspection PyArgumentList
-            return super(Box, cls).__new__(cls, min_coord, max_coord)
+            return cls._from_bounds(min_x, min_y, max_x, max_y)
         raise ValueError(*args)
 
+    @classmethod
+    def _from_bounds(cls, min_x, min_y, max_x, max_y):
+        # Private constructor: the bounds must already be validated.
+        self = object.__new__(cls)
+        _set_attr(self, 'min', _new_tuple(Coord, (min_x, min_y)))
+        _set_attr(self, 'max', _new_tuple(Coord, (max_x, max_y)))
+        _set_attr(self, '_min_x', min_x)
+        _set_attr(self, '_min_y', min_y)
+        _set_attr(self, '_max_x', max_x)
+        _set_attr(self, '_max_y', max_y)
+        return self
+
+    @classmethod
+    def _from_coords(cls, min_coord, max_coord, min_x, min_y, max_x, max_y):
+        # Private constructor: the coordinates must already be validated.
+        self = object.__new__(cls)
+        _set_attr(self, 'min', min_coord)
+        _set_attr(self, 'max', max_coord)
+        _set_attr(self, '_min_x', min_x)
+        _set_attr(self, '_min_y', min_y)
+        _set_attr(self, '_max_x', max_x)
+        _set_attr(self, '_max_y', max_y)
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError("can't set attribute")
+
+    def __delattr__(self, name):
+        raise AttributeError("can't delete attribute")
+
+    def __reduce__(self):
+        return self.__class__, (self._min_x, self._min_y, self._max_x, self._max_y)
+
+    def __iter__(self):
+        # backward compatibility: a box can be unpacked like a (min, max) tuple
+        yield self.min
+        yield self.max
+
+    def __eq__(self, other):
+        if isinstance(other, Box):
+            return (
+                self._min_x == other._min_x
+                and self._min_y == other._min_y
+                and self._max_x == other._max_x
+                and self._max_y == other._max_y
+            )
+        return NotImplemented
+
+    def __ne__(self, other):
+        # required for Python 2
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash((self.min, self.max))
+
     def __str__(self):
-        if (self.width, self.height) == (1, 1):
+        if self._min_x == self._max_x and self._min_y == self._max_y:
             return str(self.min)
         return str(self.min) + ':' + str(self.max)
 
     def __repr__(self):
-        return super(Box, self).__repr__().replace('BoxTuple', 'Box')
+        return "Box(min={0!r}, max={1!r})".format(self.min, self.max)
+
+    # note: the width and height are not cached in slots: a Box is built much more often
+    # (moves, merges, grid insertions) than its sizes are read.
 
     @property
     def width(self):
         # type: () -> int
-        return self.max.x - self.min.x + 1
+        return self._max_x - self._min_x + 1
 
     @property
     def height(self):
         # type: () -> int
-        return self.max.y - self.min.y + 1
+        return self._max_y - self._min_y + 1
 
     @property
     def size(self):
-        return Size(self.width, self.height)
+        return Size(self._max_x - self._min_x + 1, self._max_y - self._min_y + 1)
 
     def transform(self, coord=None, size=None):
-        min_coord = self.min if coord is None else Coord.from_value(coord)
-        size = self.size if size is None else Size.from_value(size)
-        max_coord = min_coord + size - 1
-        return Box(min_coord, max_coord)
+        # compute the new bounds directly, without intermediate Coord/Size objects
+        if coord is None:
+            min_x, min_y = self._min_x, self._min_y
+        else:
+            min_x, min_y = Coord.from_value(coord)
+        if size is None:
+            max_x = min_x + self._max_x - self._min_x
+            max_y = min_y + self._max_y - self._min_y
+        else:
+            width, height = Size.from_value(size)
+            max_x = min_x + width - 1
+            max_y = min_y + height - 1
+        if 0 < min_x <= max_x and 0 < min_y <= max_y:
+            return self._from_bounds(min_x, min_y, max_x, max_y)
+        raise ValueError(Coord(min_x, min_y), Coord(max_x, max_y))
 
     def move_to(self, coord):
         return self.transform(coord=coord)
@@ -208,19 +294,61 @@ class Box(BoxTuple):
         return self.transform(size=size)
 
     def __contains__(self, coord):
-        coord_type = type(coord)
-        if coord_type is Coord:
-            return self.min.x <= coord.x <= self.max.x and self.min.y <= coord.y <= self.max.y
-        elif coord_type is tuple and tuple(map(type, coord)) == (int, int):
-            return self.min.x <= coord[0] <= self.max.x and self.min.y <= coord[1] <= self.max.y
-        elif coord_type is Box:
-            return coord.min in self and coord.max in self
-        raise TypeError(repr(coord_type))
+        # fast path: Coord-like objects
+        try:
+            x = coord.x
+            y = coord.y
+        except AttributeError:
+            coord_type = type(coord)
+            if coord_type is tuple and len(coord) == 2 and type(coord[0]) is int and type(coord[1]) is int:
+                x, y = coord
+            elif coord_type is Box:
+                return (
+                    self._min_x <= coord._min_x
+                    and coord._max_x <= self._max_x
+                    and self._min_y <= coord._min_y
+                    and coord._max_y <= self._max_y
+                )
+            else:
+                raise TypeError(repr(coord_type))
+        return self._min_x <= x <= self._max_x and self._min_y <= y <= self._max_y
 
     def intersect(self, that):
         # type: (Box) -> bool
-        return ((self.min in that or self.max in that) or
-                (that.min in self or that.max in self))
+        """
+        Check if *self* intersects *that* box.
+
+        Usage:
+
+        .. doctest:: box_demo
+
+            >>> from benker.box import Box
+
+            >>> Box(1, 1, 3, 3).intersect(Box(2, 2, 4, 4))
+            True
+            >>> Box(1, 1, 3, 3).intersect(Box(4, 1, 5, 1))
+            False
+
+        Two boxes can intersect even if no corner of a box is contained in the other:
+
+        .. doctest:: box_demo
+
+            >>> Box(1, 2, 5, 2).intersect(Box(3, 1, 3, 4))
+            True
+
+        :param that: other box
+
+        :return: ``True`` if the two boxes have at least one common coordinate.
+
+        .. versionchanged:: 0.5.5
+           Fix the detection of crossing boxes.
+        """
+        return not (
+            self._max_x < that._min_x
+            or that._max_x < self._min_x
+            or self._max_y < that._min_y
+            or that._max_y < self._min_y
+        )
 
     def isdisjoint(self, that):
         # type: (Box) -> bool
@@ -249,14 +377,18 @@ class Box(BoxTuple):
 
         :return: The bounding box of all the boxes.
         """
-        boxes = (self,) + others
-        min_list = tuple(box.min for box in boxes)
-        min_coord = Coord(min(coord.x for coord in min_list), min(coord.y for coord in min_list))
-        max_list = tuple(box.max for box in boxes)
-        max_coord = Coord(max(coord.x for coord in max_list), max(coord.y for coord in max_list))
-        bounding_box = Box(min_coord, max_coord)
-        assert all(box in bounding_box for box in boxes)
-        return bounding_box
+        min_x, min_y, max_x, max_y = self._min_x, self._min_y, self._max_x, self._max_y
+        for box in others:
+            box_min_x, box_min_y, box_max_x, box_max_y = box._min_x, box._min_y, box._max_x, box._max_y
+            if box_min_x < min_x:
+                min_x = box_min_x
+            if box_min_y < min_y:
+                min_y = box_min_y
+            if box_max_x > max_x:
+                max_x = box_max_x
+            if box_max_y > max_y:
+                max_y = box_max_y
+        return Box(min_x, min_y, max_x, max_y)
 
     __or__ = union
 
@@ -285,16 +417,22 @@ class Box(BoxTuple):
 
         :raises ValueError: if the two boxes are disjoint.
         """
-        boxes = (self,) + others
-        min_list = tuple(box.min for box in boxes)
-        min_coord = Coord(max(coord.x for coord in min_list), max(coord.y for coord in min_list))
-        max_list = tuple(box.max for box in boxes)
-        max_coord = Coord(min(coord.x for coord in max_list), min(coord.y for coord in max_list))
+        min_x, min_y, max_x, max_y = self._min_x, self._min_y, self._max_x, self._max_y
+        for box in others:
+            box_min_x, box_min_y, box_max_x, box_max_y = box._min_x, box._min_y, box._max_x, box._max_y
+            if box_min_x > min_x:
+                min_x = box_min_x
+            if box_min_y > min_y:
+                min_y = box_min_y
+            if box_max_x < max_x:
+                max_x = box_max_x
+            if box_max_y < max_y:
+                max_y = box_max_y
         try:
-            return Box(min_coord, max_coord)
+            return Box(min_x, min_y, max_x, max_y)
         except ValueError:
             # the two boxes are disjoint
-            raise ValueError(boxes)
+            raise ValueError((self,) + others)
 
     __and__ = intersection
 
@@ -328,14 +466,10 @@ class Box(BoxTuple):
         :return: ``True`` if *self* < *other*
         """
         if isinstance(other, Box):
-            if self.min.y == other.min.y:
-                if self.min.x == other.min.x:
-                    if self.max.y == other.max.y:
-                        return self.max.x < other.max.x
-                    else:
-                        return self.max.y < other.max.y
-                else:
-                    return self.min.x < other.min.x
-            else:
-                return self.min.y < other.min.y
+            return (self._min_y, self._min_x, self._max_y, self._max_x) < (
+                other._min_y,
+                other._min_x,
+                other._max_y,
+                other._max_x,
+            )
         return NotImplemented
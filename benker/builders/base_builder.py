@@ -26,6 +26,49 @@ string_types = text_type, binary_type
 ElementType = etree._Element
 
 
+def _append_text(cell_elem, elements):
+    cell_elem.text = elements
+
+
+def _append_bytes(cell_elem, elements):
+    cell_elem.text = elements.decode('utf-8')  # PY2
+
+
+def _append_number(cell_elem, elements):
+    cell_elem.text = text_type(elements)
+
+
+def _append_element(cell_elem, elements):
+    cell_elem.append(elements)
+
+
+def _append_sequence(cell_elem, elements):
+    last_elem = cell_elem[-1] if len(cell_elem) else None
+    for node in elements:
+        if isinstance(node, ElementType):
+            cell_elem.append(node)
+            last_elem = node
+        elif last_elem is None:
+            text = cell_elem.text or ""
+            cell_elem.text = text + node
+        else:
+            tail = last_elem.tail or ""
+            last_elem.tail = tail + node
+
+
+#: Appenders used for the most common (exact) types of cell contents
+_APPENDERS = {
+    type(None): _append_text,
+    text_type: _append_text,
+    binary_type: _append_bytes,
+    int: _append_number,
+    float: _append_number,
+    ElementType: _append_element,
+    list: _append_sequence,
+    tuple: _append_sequence,
+}
+
+
 class BaseBuilder(object):
     """
     Base class of Builders.
@@ -71,26 +114,19 @@ class BaseBuilder(object):
 
         .. versionadded:: 0.5.1
         """
-        if elements is None:
-            cell_elem.text = elements
-        elif isinstance(elements, text_type):
-            cell_elem.text = elements
-        elif isinstance(elements, binary_type):
-            cell_elem.text = elements.decode('utf-8')  # PY2
-        elif isinstance(elements, numbers.Number):
-            cell_elem.text = text_type(elements)
-        elif isinstance(elements, ElementType):
-            cell_elem.append(elements)
-        elif isinstance(elements, Sequence):
-            for node in elements:
-                if isinstance(node, ElementType):
-                    cell_elem.append(node)
-                elif len(cell_elem) == 0:
-                    text = cell_elem.text or ""
-                    cell_elem.text = text + node
-                else:
-                    last_elem = cell_elem[-1]
-                    tail = last_elem.tail or ""
-                    last_elem.tail = tail + node
-        else:  # pragma: no cover
-            raise TypeError(repr(elements))
+        appender = _APPENDERS.get(type(elements))
+        if appender is None:
+            # subclasses (PIs, custom element classes, etc.)
+            if isinstance(elements, text_type):
+                appender = _append_text
+            elif isinstance(elements, binary_type):
+                appender = _append_bytes
+            elif isinstance(elements, numbers.Number):
+                appender = _append_number
+            elif isinstance(elements, ElementType):
+                appender = _append_element
+            elif isinstance(elements, Sequence):
+                appender = _append_sequence
+            else:  # pragma: no cover
+                raise TypeError(repr(elements))
+        appender(cell_elem, elements)
@@ -16,7 +16,7 @@ Specifications and examples:
 
 """
 import collections
-import itertools
+from xml.sax.saxutils import escape
 
 from lxml import etree
 
@@ -31,50 +31,124 @@ ElementType = etree._Element
 
 
 def _get_border_style(styles, style):
-    parts = styles.get(style, "")
-    parts = parts.split(" ") if parts else []
+    # the border style is the last part which is neither a width, nor a color
     value = None
-    for part in parts:
-        if not part.endswith("pt") and part != "auto" and not part.startswith("#"):
-            value = part
+    parts = styles.get(style)
+    if parts:
+        for part in parts.split(" "):
+            # slicing is cheaper than endswith()/startswith() method calls
+            if not (part[-2:] == "pt" or part == "auto" or part[:1] == "#"):
+                value = part
     return value
 
 
+#: ``@frame`` values indexed by the visibility of the (top, bottom, left, right) borders
+_FRAME_VALUES = {
+    (True, True, True, True): u"all",
+    (True, True, False, False): u"topbot",
+    (False, False, True, True): u"sides",
+    (True, False, False, False): u"top",
+    (False, True, False, False): u"bottom",
+}
+
+
 def get_frame_attr(styles):
-    frame_styles = {"border-top": False, "border-right": False, "border-bottom": False, "border-left": False}
-    for style in frame_styles:
-        value = _get_border_style(styles, style) or u"none"
-        frame_styles[style] = value != u"none"
-    top = frame_styles["border-top"]
-    bottom = frame_styles["border-bottom"]
-    left = frame_styles["border-left"]
-    right = frame_styles["border-right"]
-    return {
-        (True, True, True, True): u"all",
-        (True, True, False, False): u"topbot",
-        (False, False, True, True): u"sides",
-        (True, False, False, False): u"top",
-        (False, True, False, False): u"bottom",
-    }.get((top, bottom, left, right), u"none")
+    top = (_get_border_style(styles, "border-top") or u"none") != u"none"
+    bottom = (_get_border_style(styles, "border-bottom") or u"none") != u"none"
+    left = (_get_border_style(styles, "border-left") or u"none") != u"none"
+    right = (_get_border_style(styles, "border-right") or u"none") != u"none"
+    return _FRAME_VALUES.get((top, bottom, left, right), u"none")
+
+
+#: ``@colsep``/``@rowsep`` values indexed by border style (any other style is "1")
+_SEP_VALUES = {None: None, "none": "0"}
 
 
 def get_colsep_attr(styles, style="x-cell-border-right"):
-    value = _get_border_style(styles, style)
-    return None if value is None else "0" if value == "none" else "1"
+    return _SEP_VALUES.get(_get_border_style(styles, style), "1")
 
 
 def get_rowsep_attr(styles, style="x-cell-border-bottom"):
-    value = _get_border_style(styles, style)
-    return None if value is None else "0" if value == "none" else "1"
+    return _SEP_VALUES.get(_get_border_style(styles, style), "1")
+
+
+#: Entities to escape in an attribute value (in addition to "&", "<" and ">"),
+#: like lxml does when it serializes an attribute.
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+
+_WIDTH_CACHE_MAXSIZE = 1024
+
+#: Memoized width conversions: (width, width_unit) => formatted width
+_WIDTH_CACHE = {}
+
+
+def format_width(width, width_unit):
+    """
+    Convert a width (with its unit) to the given unit, and format it with 2 decimals.
+
+    Column widths are often the same: the conversions are memoized.
+
+    :param str width: width to convert, for instance: "1.5cm".
+    :param str width_unit: unit of the result.
+    :return: the formatted width, for instance: "15.00mm".
+    """
+    key = (width, width_unit)
+    result = _WIDTH_CACHE.get(key)
+    if result is None:
+        value, unit = parse_width(width)
+        value = convert_value(value, unit, width_unit)
+        result = u"{value:0.2f}{unit}".format(value=value, unit=width_unit)
+        if len(_WIDTH_CACHE) >= _WIDTH_CACHE_MAXSIZE:
+            _WIDTH_CACHE.clear()
+        _WIDTH_CACHE[key] = result
+    return result
 
 
 def revision_mark(name, attrs):
-    target = etree.tounicode(etree.Element(name, attrib=attrs))
-    target = target.replace("<{0} ".format(name), "").replace("/>", "")
+    target = u" ".join(u'{0}="{1}"'.format(key, escape(value, _ATTR_ENTITIES)) for key, value in attrs.items())
     rev_pi = etree.ProcessingInstruction(name, target)
     return rev_pi
 
 
+#: ``@orient`` values indexed by the "x-sect-orient" style
+_ORIENT_VALUES = {"landscape": u"land", "portrait": u"port"}
+
+#: ``@align`` values indexed by the "align" style (same values as CSS/Properties/text-align)
+_ALIGN_VALUES = {"left": u"left", "center": u"center", "right": u"right", "justify": u"justify"}
+
+#: Row ``@valign`` values indexed by the "vertical-align" style (same values as CSS/Properties/vertical-align)
+_ROW_VALIGN_VALUES = {"top": u"top", "middle": u"middle", "bottom": u"bottom", "baseline": u"bottom"}
+
+#: Cell ``@valign`` values indexed by the "vertical-align" style,
+#: 'w-both' is an extension of OoxmlParser
+_CELL_VALIGN_VALUES = dict(_ROW_VALIGN_VALUES, **{"w-both": u"bottom"})
+
+_NUMBERS_SIZE = 1024
+
+#: Preformatted numbers and column names (for ``@colnum``, ``@colname``, ``@namest``, ``@morerows``...)
+_NUMBERS = tuple(u"{0}".format(pos) for pos in range(_NUMBERS_SIZE))
+_COL_NAMES = tuple(u"c{0}".format(pos) for pos in range(_NUMBERS_SIZE))
+
+#: Cell styles used to build the ``<entry>`` attributes
+_CELL_STYLES = frozenset(
+    ["border-right", "border-bottom", "vertical-align", "align", "background-color", "cellstyle"]
+)
+
+#: Row group elements indexed by row nature
+_GROUP_TAGS = {"header": u"thead", "body": u"tbody", "footer": u"tfoot"}
+
+#: Names of the CALS elements and attributes generated by the builder.
+_CALS_NAMES = (
+    # elements
+    u"table", u"tgroup", u"colspec", u"thead", u"tbody", u"tfoot", u"row", u"entry",
+    # attributes
+    u"align", u"bgcolor", u"cellstyle", u"cols", u"colname", u"colnum", u"colsep", u"colwidth",
+    u"frame", u"morerows", u"nameend", u"namest", u"orient", u"pgwide", u"rowsep", u"rowstyle",
+    u"tabstyle", u"tgroupstyle", u"valign", u"width",
+)
+
+
 class CalsBuilder(BaseBuilder):
     """
     CALS table builder.
@@ -122,9 +196,15 @@ class CalsBuilder(BaseBuilder):
         self._table = None
         self._table_colsep = u"0"
         self._table_rowsep = u"0"
+        self._table_max_x = 0
+        self._table_max_y = 0
+        # attributes of the <entry> being built (lxml copies them in the element)
+        self._entry_attrs = {}
         # options
         self._ns_map = {}
         self.cals_ns = self._register_namespace(cals_prefix, cals_ns)
+        # qualified names are invariant for a builder: compute them once
+        self._cals_qnames = {name: self.cals_ns.get_qname(name).text for name in _CALS_NAMES}
         self.width_unit = width_unit
         self.table_in_tgroup = table_in_tgroup
         tgroup_sorting_default = ["header", "footer", "body"]
@@ -170,6 +250,13 @@ class CalsBuilder(BaseBuilder):
         self._table = table
         self._table_colsep = u"0"
         self._table_rowsep = u"0"
+        # the bounding box is computed from all the cells: compute it once
+        bounding_box = table.bounding_box
+        if bounding_box is None:
+            self._table_max_x = self._table_max_y = 0
+        else:
+            self._table_max_x = bounding_box.max.x
+            self._table_max_y = bounding_box.max.y
         return self._table  # mainly for unit tests
 
     def build_table(self, table):
@@ -228,26 +315,25 @@ class CalsBuilder(BaseBuilder):
         self.setup_table(table)
 
         # support for CALS namespace
-        cals = self.cals_ns.get_qname
+        cals = self._cals_qnames
         table_styles = table.styles
-        attrs = {cals('frame'): get_frame_attr(table_styles)}
+        attrs = {cals['frame']: get_frame_attr(table_styles)}
         if not self.table_in_tgroup:
-            self._table_colsep = attrs[cals("colsep")] = get_colsep_attr(table_styles) or "0"
-            self._table_rowsep = attrs[cals("rowsep")] = get_rowsep_attr(table_styles) or "0"
+            self._table_colsep = attrs[cals["colsep"]] = get_colsep_attr(table_styles) or "0"
+            self._table_rowsep = attrs[cals["rowsep"]] = get_rowsep_attr(table_styles) or "0"
             if table.nature is not None:
-                attrs[cals("tabstyle")] = table.nature
+                attrs[cals["tabstyle"]] = table.nature
         if "x-sect-orient" in table_styles:
-            attrs[cals("orient")] = {"landscape": "land", "portrait": "port"}[table_styles["x-sect-orient"]]
+            attrs[cals["orient"]] = _ORIENT_VALUES[table_styles["x-sect-orient"]]
         if "x-sect-cols" in table_styles:
-            attrs[cals("pgwide")] = "1" if table_styles["x-sect-cols"] == "1" else "0"
+            attrs[cals["pgwide"]] = "1" if table_styles["x-sect-cols"] == "1" else "0"
         if "background-color" in table_styles:
-            attrs[cals("bgcolor")] = table_styles["background-color"]
+            attrs[cals["bgcolor"]] = table_styles["background-color"]
         if "width" in table_styles:
-            width, unit = parse_width(table_styles["width"])
-            value = convert_value(width, unit, self.width_unit)
-            attrs[cals("width")] = u"{value:0.2f}{unit}".format(value=value, unit=self.width_unit)
+            attrs[cals["width"]] = format_width(table_styles["width"], self.width_unit)
 
-        table_elem = etree.Element(cals(u"table"), attrib=attrs, nsmap=self.ns_map)
+        # the namespaces are declared once, on the root element, descendants inherit them
+        table_elem = etree.Element(cals[u"table"], attrib=attrs, nsmap=self.ns_map)
         self.build_tgroup(table_elem, table)
         return table_elem
 
@@ -279,27 +365,33 @@ class CalsBuilder(BaseBuilder):
         :param table: Table
 
         :return: The newly-created ``<tgroup>`` element.
+
+        .. versionchanged:: 0.5.5
+           The rows of a same nature are grouped together, even if they are not contiguous.
         """
         # support for CALS namespace
-        cals = self.cals_ns.get_qname
+        cals = self._cals_qnames
         table_styles = table.styles
-        attrs = {cals(u"cols"): str(len(table.cols))}
+        cols = table.cols
+        attrs = {cals[u"cols"]: str(len(cols))}
         if self.table_in_tgroup:
-            self._table_colsep = attrs[cals("colsep")] = get_colsep_attr(table_styles) or "0"
-            self._table_rowsep = attrs[cals("rowsep")] = get_rowsep_attr(table_styles) or "0"
+            self._table_colsep = attrs[cals["colsep"]] = get_colsep_attr(table_styles) or "0"
+            self._table_rowsep = attrs[cals["rowsep"]] = get_rowsep_attr(table_styles) or "0"
             if table.nature is not None:
-                attrs[cals("tgroupstyle")] = table.nature
-        group_elem = etree.SubElement(table_elem, cals(u"tgroup"), attrib=attrs, nsmap=self.ns_map)
-        for col in table.cols:
+                attrs[cals["tgroupstyle"]] = table.nature
+        group_elem = etree.SubElement(table_elem, cals[u"tgroup"], attrib=attrs)
+        for col in cols:
             self.build_colspec(group_elem, col)
-        # -- group rows by header/body/footer
-        groups = [(k, list(g)) for k, g in itertools.groupby(table.rows, key=lambda r: r.nature)]
+        # -- group rows by header/body/footer (rows of other natures are body rows)
+        groups = {"header": [], "body": [], "footer": []}
+        body_rows = groups["body"]
+        for row in table.rows:
+            groups.get(row.nature, body_rows).append(row)
         # -- sort the groups in the order: header => footer => body
-        groups = sorted(groups, key=lambda item: self.tgroup_sorting.get(item[0], self.tgroup_sorting["body"]))
-        group_tags = {"header": u"thead", "body": u"tbody", "footer": u"tfoot"}
-        for nature, row_list in groups:
-            nature_tag = group_tags.get(nature, group_tags["body"])
-            self.build_tbody(group_elem, row_list, nature_tag)
+        for nature in sorted(groups, key=self.tgroup_sorting.get):
+            row_list = groups[nature]
+            if row_list:
+                self.build_tbody(group_elem, row_list, _GROUP_TAGS[nature])
 
     # noinspection PyMethodMayBeStatic
     def build_colspec(self, group_elem, col):
@@ -337,34 +429,35 @@ class CalsBuilder(BaseBuilder):
            The ``@colsep`` and ``@rowsep`` attributes are generated.
         """
         # support for CALS namespace
-        cals = self.cals_ns.get_qname
+        cals = self._cals_qnames
         col_styles = col.styles
 
         # -- @cals:colnum
         # -- @cals:colname
-        attrs = {cals(u"colnum"): u"{0}".format(col.col_pos), cals(u"colname"): u"c{0}".format(col.col_pos)}
+        col_pos = col.col_pos
+        if col_pos < _NUMBERS_SIZE:
+            attrs = {cals[u"colnum"]: _NUMBERS[col_pos], cals[u"colname"]: _COL_NAMES[col_pos]}
+        else:
+            attrs = {cals[u"colnum"]: u"{0}".format(col_pos), cals[u"colname"]: u"c{0}".format(col_pos)}
 
         # -- @cals:colwidth
         if "width" in col_styles:
-            width, unit = parse_width(col_styles["width"])
-            value = convert_value(width, unit, self.width_unit)
-            attrs[cals("colwidth")] = u"{value:0.2f}{unit}".format(value=value, unit=self.width_unit)
+            attrs[cals["colwidth"]] = format_width(col_styles["width"], self.width_unit)
 
         # -- @cals:align
         align = col_styles.get("align")
-        align_map = {"left": "left", "right": "right", "center": "center", "justify": "justify"}
-        if align in align_map:
-            attrs[cals("align")] = align_map[align]
+        if align in _ALIGN_VALUES:
+            attrs[cals["align"]] = _ALIGN_VALUES[align]
 
         cell_colsep = get_colsep_attr(col_styles, "border-right")
         if cell_colsep and cell_colsep != self._table_colsep:
-            attrs[cals("colsep")] = cell_colsep
+            attrs[cals["colsep"]] = cell_colsep
 
         cell_rowsep = get_rowsep_attr(col_styles, "border-bottom")
         if cell_rowsep and cell_rowsep != self._table_rowsep:
-            attrs[cals("rowsep")] = cell_rowsep
+            attrs[cals["rowsep"]] = cell_rowsep
 
-        etree.SubElement(group_elem, cals(u"colspec"), attrib=attrs, nsmap=self.ns_map)
+        etree.SubElement(group_elem, cals[u"colspec"], attrib=attrs)
 
     def build_tbody(self, group_elem, row_list, nature_tag):
         """
@@ -378,8 +471,8 @@ class CalsBuilder(BaseBuilder):
         :param nature_tag: name of the tag: 'tbody', 'thead' or 'tfoot'.
         """
         # support for CALS namespace
-        cals = self.cals_ns.get_qname
-        nature_elem = etree.SubElement(group_elem, cals(nature_tag), nsmap=self.ns_map)
+        cals = self._cals_qnames
+        nature_elem = etree.SubElement(group_elem, cals[nature_tag])
         for row in row_list:
             self.build_row(nature_elem, row)
 
@@ -424,50 +517,44 @@ class CalsBuilder(BaseBuilder):
         # - Vertical align: 'valign'
         #
         # support for CALS namespace
-        cals = self.cals_ns.get_qname
+        cals = self._cals_qnames
         row_styles = row.styles
         attrs = {}
-        if "vertical-align" in row_styles:
-            # same values as CSS/Properties/vertical-align
-            # fmt: off
-            attrs[cals('valign')] = {
-                'top': 'top',
-                'middle': 'middle',
-                'bottom': 'bottom',
-                'baseline': 'bottom',
-            }[row_styles['vertical-align']]
-            # fmt: on
+        get_style = row_styles.get
+        valign = get_style("vertical-align")
+        if valign is not None:
+            attrs[cals['valign']] = _ROW_VALIGN_VALUES[valign]
 
         row_rowsep = get_rowsep_attr(row_styles, "border-bottom")
         if row_rowsep and row_rowsep != self._table_rowsep:
-            attrs[cals("rowsep")] = row_rowsep
+            attrs[cals["rowsep"]] = row_rowsep
 
         # -- attribute @cals:rowstyle (extension)
-        if "rowstyle" in row_styles:
-            attrs[cals("rowstyle")] = row_styles["rowstyle"]
+        rowstyle = get_style("rowstyle")
+        if rowstyle is not None:
+            attrs[cals["rowstyle"]] = rowstyle
 
-        if "x-ins" in row_styles:
-            # <?change-start change-id="ct140446841083680" type="row:insertion"
-            #   creator="Anita BARREL" date="2017-11-15T11:46:00"?>
-            rev_attrs = collections.OrderedDict({'type': 'row:insertion'})
-            if 'x-ins-id' in row_styles:
-                rev_attrs['change-id'] = "ct{0}".format(row_styles['x-ins-id'])
-            if 'x-ins-author' in row_styles:
-                rev_attrs['creator'] = row_styles['x-ins-author']
-            if 'x-ins-date' in row_styles:
-                rev_attrs['date'] = row_styles['x-ins-date']
-            rev_pi = revision_mark("change-start", rev_attrs)
-            tbody_elem.append(rev_pi)
-
-        row_elem = etree.SubElement(tbody_elem, cals(u"row"), attrib=attrs, nsmap=self.ns_map)
+        row_elem = etree.SubElement(tbody_elem, cals[u"row"], attrib=attrs)
 
         if "x-ins" in row_styles:
+            # the revision marks are inserted around the row element
             # <?change-end change-id="ct139821811327752" type="row:insertion"?>
-            rev_attrs = collections.OrderedDict({'type': 'row:insertion'})
-            if 'x-ins-id' in row_styles:
-                rev_attrs['change-id'] = "ct{0}".format(row_styles['x-ins-id'])
-            rev_pi = revision_mark('change-end', rev_attrs)
-            tbody_elem.append(rev_pi)
+            # (the order of the attributes matters: an OrderedDict is required for Python < 3.7)
+            rev_attrs = collections.OrderedDict([('type', 'row:insertion')])
+            ins_id = get_style('x-ins-id')
+            if ins_id is not None:
+                rev_attrs['change-id'] = "ct{0}".format(ins_id)
+            row_elem.addnext(revision_mark('change-end', rev_attrs))
+
+            # <?change-start change-id="ct140446841083680" type="row:insertion"
+            #   creator="Anita BARREL" date="2017-11-15T11:46:00"?>
+            ins_author = get_style('x-ins-author')
+            if ins_author is not None:
+                rev_attrs['creator'] = ins_author
+            ins_date = get_style('x-ins-date')
+            if ins_date is not None:
+                rev_attrs['date'] = ins_date
+            row_elem.addprevious(revision_mark("change-start", rev_attrs))
 
         for cell in row.owned_cells:
             self.build_cell(row_elem, cell)
@@ -523,49 +610,51 @@ class CalsBuilder(BaseBuilder):
            This style will keep the ``CELL/@TYPE`` value.
         """
         # support for CALS namespace
-        cals = self.cals_ns.get_qname
+        cals = self._cals_qnames
         cell_styles = cell.styles
-        attrs = {}
-        if cell.box.max.x != self._table.bounding_box.max.x:
+        cell_box = cell.box
+        if cell_box.width == 1 and cell_box.height == 1 and _CELL_STYLES.isdisjoint(cell_styles):
+            # fast path: a cell without span and without CALS style has no attribute
+            entry_elem = etree.SubElement(row_elem, cals[u"entry"])
+            self.append_cell_elements(entry_elem, cell.content)
+            return
+
+        cell_max = cell_box.max
+        attrs = self._entry_attrs
+        attrs.clear()
+        # same as get_colsep_attr()/get_rowsep_attr(), without the extra function calls
+        if cell_max.x != self._table_max_x:
             # generate @colsep if the cell isn't in the last column
-            cell_colsep = get_colsep_attr(cell_styles, "border-right")
+            cell_colsep = _SEP_VALUES.get(_get_border_style(cell_styles, "border-right"), "1")
             if cell_colsep and cell_colsep != self._table_colsep:
-                attrs[cals("colsep")] = cell_colsep
-        if cell.box.max.y != self._table.bounding_box.max.y:
+                attrs[cals["colsep"]] = cell_colsep
+        if cell_max.y != self._table_max_y:
             # generate @rowsep if the cell isn't in the last row
-            cell_rowsep = get_rowsep_attr(cell_styles, "border-bottom")
+            cell_rowsep = _SEP_VALUES.get(_get_border_style(cell_styles, "border-bottom"), "1")
             if cell_rowsep and cell_rowsep != self._table_rowsep:
-                attrs[cals("rowsep")] = cell_rowsep
-        if "vertical-align" in cell_styles:
-            # same values as CSS/Properties/vertical-align
-            # 'w-both' is an extension of OoxmlParser
-            attrs[cals('valign')] = {
-                'top': u'top',
-                'middle': u'middle',
-                'bottom': u'bottom',
-                'baseline': u'bottom',
-                'w-both': u'bottom',
-            }[cell_styles['vertical-align']]
-        if 'align' in cell_styles:
-            # same values as CSS/Properties/text-align
-            # fmt: off
-            attrs[cals('align')] = {
-                'left': u'left',
-                'center': u'center',
-                'right': u'right',
-                'justify': u'justify',
-            }[cell_styles['align']]
-            # fmt: on
-        if cell.width > 1:
-            attrs[cals("namest")] = u"c{0}".format(cell.box.min.x)
-            attrs[cals("nameend")] = u"c{0}".format(cell.box.max.x)
-        if cell.height > 1:
-            attrs[cals("morerows")] = str(cell.height - 1)
-        if "background-color" in cell_styles:
-            attrs[cals("bgcolor")] = cell_styles["background-color"]
+                attrs[cals["rowsep"]] = cell_rowsep
+        get_style = cell_styles.get
+        valign = get_style("vertical-align")
+        if valign is not None:
+            attrs[cals['valign']] = _CELL_VALIGN_VALUES[valign]
+        align = get_style("align")
+        if align is not None:
+            attrs[cals['align']] = _ALIGN_VALUES[align]
+        if cell_box.width > 1:
+            min_x = cell_box.min.x
+            max_x = cell_max.x
+            attrs[cals["namest"]] = _COL_NAMES[min_x] if min_x < _NUMBERS_SIZE else u"c{0}".format(min_x)
+            attrs[cals["nameend"]] = _COL_NAMES[max_x] if max_x < _NUMBERS_SIZE else u"c{0}".format(max_x)
+        if cell_box.height > 1:
+            more_rows = cell_box.height - 1
+            attrs[cals["morerows"]] = _NUMBERS[more_rows] if more_rows < _NUMBERS_SIZE else u"{0}".format(more_rows)
+        bgcolor = get_style("background-color")
+        if bgcolor is not None:
+            attrs[cals["bgcolor"]] = bgcolor
         # -- attribute @cals:cellstyle (extension)
-        if "cellstyle" in cell_styles:
-            attrs[cals("cellstyle")] = cell_styles["cellstyle"]
+        cellstyle = get_style("cellstyle")
+        if cellstyle is not None:
+            attrs[cals["cellstyle"]] = cellstyle
 
-        entry_elem = etree.SubElement(row_elem, cals(u"entry"), attrib=attrs, nsmap=self.ns_map)
+        entry_elem = etree.SubElement(row_elem, cals[u"entry"], attrib=attrs)
         self.append_cell_elements(entry_elem, cell.content)
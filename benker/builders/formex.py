@@ -28,20 +28,25 @@ Specifications and examples:
    - the class ``Formex4Builder`` is renamed ``FormexBuilder``,
 """
 import collections
+import itertools
 import re
 
 from lxml import etree
 
 from benker.builders.base_builder import BaseBuilder
+from benker.builders.cals import _ALIGN_VALUES
+from benker.builders.cals import _CELL_VALIGN_VALUES
+from benker.builders.cals import _ORIENT_VALUES
+from benker.builders.cals import _ROW_VALIGN_VALUES
+from benker.builders.cals import format_width
 from benker.builders.cals import get_colsep_attr
 from benker.builders.cals import get_frame_attr
 from benker.builders.cals import get_rowsep_attr
+from benker.builders.cals import revision_mark
 from benker.common.lxml_iterwalk import iterwalk
 from benker.common.lxml_qname import QName
 from benker.schemas import CALS_NS
 from benker.schemas import CALS_PREFIX
-from benker.units import convert_value
-from benker.units import parse_width
 
 # noinspection PyProtectedMember
 #: ElementTree Type
@@ -58,28 +63,42 @@ ProcessingInstructionType = etree._ProcessingInstruction  # pylint: disable=C010
 text_type = type(u"")
 
 
-def revision_mark(name, attrs):
-    target = etree.tounicode(etree.Element(name, attrib=attrs))
-    target = target.replace("<{0} ".format(name), "").replace("/>", "")
-    rev_pi = etree.ProcessingInstruction(name, target)
-    return rev_pi
+RowInfo = collections.namedtuple("RowInfo", "tag, type, level")
 
+#: Regex used to parse a row style, for instance: "TI.BLK-level2"
+_ROWSTYLE_REGEX = re.compile(
+    r"""^
+    (ROW | TI\.BLK | STI\.BLK)
+    (?: - (ALIAS|HEADER|NORMAL|NOTCOL|TOTAL) )?
+    (?: - level(\d+) )?
+    $""",
+    flags=re.VERBOSE,
+)
 
-RowInfo = collections.namedtuple("RowInfo", "tag, type, level")
+#: Regex used to parse a column number, for instance: "c3"
+_COLNUM_REGEX = re.compile(r"\d+")
+
+#: XPath expression used to finalize the Formex tree (compiled once)
+_CELL_XPATH = etree.XPath("CELL")
+
+
+#: ``ROW/@TYPE`` values indexed by the row nature
+_ROW_TYPE_VALUES = {"header": u"HEADER", "footer": u"__GR.NOTES__"}
+
+#: ``CELL/@TYPE`` values indexed by the cell nature
+_CELL_TYPE_VALUES = {"header": u"HEADER", "body": u"NORMAL", "footer": u"__GR.NOTES__"}
+
+#: ``TBL/@PAGE.SIZE`` values indexed by the "x-sect-orient" style, for A4 (or C4) pages
+_SINGLE_PAGE_SIZE_VALUES = {"landscape": u"SINGLE.LANDSCAPE"}
+
+#: ``TBL/@PAGE.SIZE`` values indexed by the "x-sect-orient" style, for pages bigger than C4
+_DOUBLE_PAGE_SIZE_VALUES = {"landscape": u"DOUBLE.LANDSCAPE", "portrait": u"DOUBLE.PORTRAIT"}
 
 
 def guess_row_info(rowstyle):
     if rowstyle is None:
         return RowInfo("ROW", None, 0)
-    mo = re.match(
-        r"""^
-        (ROW | TI\.BLK | STI\.BLK)
-        (?: - (ALIAS|HEADER|NORMAL|NOTCOL|TOTAL) )?
-        (?: - level(\d+) )?
-        $""",
-        rowstyle,
-        flags=re.VERBOSE,
-    )
+    mo = _ROWSTYLE_REGEX.match(rowstyle)
     if mo:
         info_tag = mo.group(1)
         info_type = mo.group(2)
@@ -138,6 +157,8 @@ class FormexBuilder(BaseBuilder):
         self._table = None
         self._table_colsep = u"0"  # for cals
         self._table_rowsep = u"0"  # for cals
+        self._table_max_x = 0  # for cals
+        self._table_max_y = 0  # for cals
 
         # NO.SEQ counter
         self._no_seq = 0
@@ -149,6 +170,10 @@ class FormexBuilder(BaseBuilder):
         self.cals_prefix = cals_prefix or None
         self.width_unit = width_unit
 
+        # qualified names are invariant for a builder: they are memoized
+        self._cals_qnames = {}
+        self._formex_qnames = {}
+
         super(FormexBuilder, self).__init__(**options)
 
     @property
@@ -158,11 +183,17 @@ class FormexBuilder(BaseBuilder):
         return {}
 
     def get_cals_qname(self, name):
-        return QName(self.cals_ns, name)
+        qname = self._cals_qnames.get(name)
+        if qname is None:
+            qname = self._cals_qnames[name] = QName(self.cals_ns, name)
+        return qname
 
     def get_formex_qname(self, name):
         # note: in the future, we will use a Formex namespace
-        return QName(None, name)
+        qname = self._formex_qnames.get(name)
+        if qname is None:
+            qname = self._formex_qnames[name] = QName(None, name)
+        return qname
 
     def generate_table_tree(self, table):
         """
@@ -180,6 +211,13 @@ class FormexBuilder(BaseBuilder):
         self._table = table
         self._table_colsep = u"0"
         self._table_rowsep = u"0"
+        # the bounding box is computed from all the cells: compute it once
+        bounding_box = table.bounding_box
+        if bounding_box is None:
+            self._table_max_x = self._table_max_y = 0
+        else:
+            self._table_max_x = bounding_box.max.x
+            self._table_max_y = bounding_box.max.y
         return self._table  # mainly for unit tests
 
     def build_tbl(self, table):
@@ -232,9 +270,9 @@ class FormexBuilder(BaseBuilder):
             size = table_styles.get("x-sect-size", (595, 842))
             # C4 format 22.9cm x 32.4cm is a little bigger than A4
             if (size[0] <= 649 and size[1] <= 918) or (size[0] <= 918 and size[1] <= 649):
-                orient_page_sizes = {"landscape": "SINGLE.LANDSCAPE"}
+                orient_page_sizes = _SINGLE_PAGE_SIZE_VALUES
             else:
-                orient_page_sizes = {"landscape": "DOUBLE.LANDSCAPE", "portrait": "DOUBLE.PORTRAIT"}
+                orient_page_sizes = _DOUBLE_PAGE_SIZE_VALUES
             orient = table_styles["x-sect-orient"]
             if orient in orient_page_sizes:
                 attrs["PAGE.SIZE"] = orient_page_sizes[orient]
@@ -262,10 +300,11 @@ class FormexBuilder(BaseBuilder):
            Add support for the ``@width`` CALS-like attribute (table width).
         """
         table_styles = table.styles
-        attrs = {}  # no attribute
-        rows = list(table.rows)
+        rows = table.rows
 
         if self.detect_titles:
+            # a copy of the rows is required to remove the title row
+            rows = list(rows)
             # Does the first row/cell contains a centered title?
             first_cell = table[(1, 1)]
             align = first_cell.styles.get("align")
@@ -276,31 +315,29 @@ class FormexBuilder(BaseBuilder):
         # support for CALS-like elements and attributes
         if self.use_cals:
             cals = self.get_cals_qname
-            attrs[cals("frame")] = get_frame_attr(table_styles)
+            attrs = {cals("frame"): get_frame_attr(table_styles)}
             self._table_colsep = attrs[cals("colsep")] = get_colsep_attr(table_styles) or "0"
             self._table_rowsep = attrs[cals("rowsep")] = get_rowsep_attr(table_styles) or "0"
             if table.nature is not None:
                 attrs[cals("tabstyle")] = table.nature
             if "x-sect-orient" in table_styles:
-                attrs[cals("orient")] = {"landscape": "land", "portrait": "port"}[table_styles["x-sect-orient"]]
+                attrs[cals("orient")] = _ORIENT_VALUES[table_styles["x-sect-orient"]]
             if "x-sect-cols" in table_styles:
                 attrs[cals("pgwide")] = "1" if table_styles["x-sect-cols"] == "1" else "0"
             if "background-color" in table_styles:
                 attrs[cals("bgcolor")] = table_styles["background-color"]
             if "width" in table_styles:
-                width, unit = parse_width(table_styles["width"])
-                value = convert_value(width, unit, self.width_unit)
-                attrs[cals("width")] = u"{value:0.2f}{unit}".format(value=value, unit=self.width_unit)
+                attrs[cals("width")] = format_width(table_styles["width"], self.width_unit)
 
-        corpus_elem = etree.SubElement(tbl_elem, u"CORPUS", attrib=attrs)
-
-        # support for CALS-like elements and attributes
-        if self.use_cals:
+            corpus_elem = etree.SubElement(tbl_elem, u"CORPUS", attrib=attrs)
             for col in table.cols:
                 self.build_colspec(corpus_elem, col)
+        else:
+            corpus_elem = etree.SubElement(tbl_elem, u"CORPUS")
 
+        build_row = self.build_row
         for row in rows:
-            self.build_row(corpus_elem, row)
+            build_row(corpus_elem, row)
 
     def build_title(self, tbl_elem, row):
         """
@@ -328,24 +365,25 @@ class FormexBuilder(BaseBuilder):
         title_elem = etree.SubElement(tbl_elem, u"TITLE")
         for cell in row.owned_cells:
             # When a cell is empty, we need to insert the ``<IE/>`` tag.
-            is_empty_cell = cell.styles.get("x-cell-empty", "false") == "true"
             # We can also have an empty content if a short row is completed by empty cells.
-            if is_empty_cell or cell.content is None or cell.content == "":
+            content = cell.content
+            if cell.styles.get("x-cell-empty") == "true" or content is None or content == "":
                 # assert cell.content in {None, "", []}
                 ti_elem = etree.SubElement(title_elem, u"TI")
                 etree.SubElement(ti_elem, u"IE")
             else:
-                if isinstance(cell.content, type(u"")):
+                if isinstance(content, text_type):
                     # mainly useful for unit test
                     ti_elem = etree.SubElement(title_elem, u"TI")
                     p_elem = etree.SubElement(ti_elem, u"P")
-                    p_elem.text = cell.content
+                    p_elem.text = content
                 else:
-                    paragraphs = list(cell.content)
+                    # the first paragraph is the title, the next ones are the subtitle
+                    paragraphs = iter(content)
                     ti_elem = etree.SubElement(title_elem, u"TI")
-                    ti_elem.append(paragraphs[0])
+                    ti_elem.extend(itertools.islice(paragraphs, 1))
                     sti_elem = etree.SubElement(title_elem, u"STI")
-                    sti_elem.extend(paragraphs[1:])
+                    sti_elem.extend(paragraphs)
 
     def build_colspec(self, group_elem, col):
         """
@@ -392,19 +430,17 @@ class FormexBuilder(BaseBuilder):
 
         # -- @cals:colnum
         # -- @cals:colname
-        attrs = {cals(u"colnum"): u"{0}".format(col.col_pos), cals(u"colname"): u"c{0}".format(col.col_pos)}
+        col_pos = col.col_pos
+        attrs = {cals(u"colnum"): str(col_pos), cals(u"colname"): u"c{0}".format(col_pos)}
 
         # -- @cals:colwidth
         if "width" in col_styles:
-            width, unit = parse_width(col_styles["width"])
-            value = convert_value(width, unit, self.width_unit)
-            attrs[cals("colwidth")] = u"{value:0.2f}{unit}".format(value=value, unit=self.width_unit)
+            attrs[cals("colwidth")] = format_width(col_styles["width"], self.width_unit)
 
         # -- @cals:align
         align = col_styles.get("align")
-        align_map = {"left": "left", "right": "right", "center": "center", "justify": "justify"}
-        if align in align_map:
-            attrs[cals("align")] = align_map[align]
+        if align in _ALIGN_VALUES:
+            attrs[cals("align")] = _ALIGN_VALUES[align]
 
         cell_colsep = get_colsep_attr(col_styles, "border-right")
         if cell_colsep and cell_colsep != self._table_colsep:
@@ -414,7 +450,7 @@ class FormexBuilder(BaseBuilder):
         if cell_rowsep and cell_rowsep != self._table_rowsep:
             attrs[cals("rowsep")] = cell_rowsep
 
-        etree.SubElement(group_elem, cals(u"colspec"), attrib=attrs, nsmap=self.ns_map)
+        etree.SubElement(group_elem, cals(u"colspec"), attrib=attrs)
 
     def build_row(self, corpus_elem, row):
         """
@@ -455,23 +491,14 @@ class FormexBuilder(BaseBuilder):
         """
         row_styles = row.styles
         attrs = {}
-        nature_types = {"header": u"HEADER", "footer": u"__GR.NOTES__"}
-        if row.nature in nature_types:
-            attrs["TYPE"] = nature_types[row.nature]
+        if row.nature in _ROW_TYPE_VALUES:
+            attrs["TYPE"] = _ROW_TYPE_VALUES[row.nature]
 
         # support for CALS-like elements and attributes
         if self.use_cals:
             cals = self.get_cals_qname
             if "vertical-align" in row_styles:
-                # same values as CSS/Properties/vertical-align
-                # fmt: off
-                attrs[cals('valign')] = {
-                    'top': 'top',
-                    'middle': 'middle',
-                    'bottom': 'bottom',
-                    'baseline': 'bottom',
-                }[row_styles['vertical-align']]
-                # fmt: on
+                attrs[cals('valign')] = _ROW_VALIGN_VALUES[row_styles['vertical-align']]
             row_rowsep = get_rowsep_attr(row_styles, "border-bottom")
             if row_rowsep and row_rowsep != self._table_rowsep:
                 attrs[cals("rowsep")] = row_rowsep
@@ -480,31 +507,32 @@ class FormexBuilder(BaseBuilder):
             if "background-color" in row_styles:
                 attrs[cals("bgcolor")] = row_styles["background-color"]
 
-        if "x-ins" in row_styles:
-            # <?change-start change-id="ct140446841083680" type="row:insertion"
-            #   creator="Anita BARREL" date="2017-11-15T11:46:00"?>
-            rev_attrs = collections.OrderedDict({'type': 'row:insertion'})
-            if 'x-ins-id' in row_styles:
-                rev_attrs['change-id'] = "ct{0}".format(row_styles['x-ins-id'])
-            if 'x-ins-author' in row_styles:
-                rev_attrs['creator'] = row_styles['x-ins-author']
-            if 'x-ins-date' in row_styles:
-                rev_attrs['date'] = row_styles['x-ins-date']
-            rev_pi = revision_mark("change-start", rev_attrs)
-            corpus_elem.append(rev_pi)
-
         row_elem = etree.SubElement(corpus_elem, u"ROW", attrib=attrs)
 
         if "x-ins" in row_styles:
+            # the revision marks are inserted around the row element
             # <?change-end change-id="ct139821811327752" type="row:insertion"?>
-            rev_attrs = collections.OrderedDict({'type': 'row:insertion'})
-            if 'x-ins-id' in row_styles:
-                rev_attrs['change-id'] = "ct{0}".format(row_styles['x-ins-id'])
-            rev_pi = revision_mark('change-end', rev_attrs)
-            corpus_elem.append(rev_pi)
+            # (the order of the attributes matters: an OrderedDict is required for Python < 3.7)
+            get_style = row_styles.get
+            rev_attrs = collections.OrderedDict([('type', 'row:insertion')])
+            ins_id = get_style('x-ins-id')
+            if ins_id is not None:
+                rev_attrs['change-id'] = "ct{0}".format(ins_id)
+            row_elem.addnext(revision_mark('change-end', rev_attrs))
 
+            # <?change-start change-id="ct140446841083680" type="row:insertion"
+            #   creator="Anita BARREL" date="2017-11-15T11:46:00"?>
+            ins_author = get_style('x-ins-author')
+            if ins_author is not None:
+                rev_attrs['creator'] = ins_author
+            ins_date = get_style('x-ins-date')
+            if ins_date is not None:
+                rev_attrs['date'] = ins_date
+            row_elem.addprevious(revision_mark("change-start", rev_attrs))
+
+        build_cell = self.build_cell
         for cell in row.owned_cells:
-            self.build_cell(row_elem, cell, row)
+            build_cell(row_elem, cell, row)
 
     # noinspection PyMethodMayBeStatic
     def build_cell(self, row_elem, cell, row):
@@ -569,72 +597,67 @@ class FormexBuilder(BaseBuilder):
            This style will keep the ``CELL/@TYPE`` value.
         """
         cell_styles = cell.styles
-        attrs = {"COL": str(cell.box.min.x)}
-        if cell.nature and cell.nature != row.nature:
-            nature_types = {"header": u"HEADER", "body": u"NORMAL", "footer": u"__GR.NOTES__"}
-            attrs["TYPE"] = nature_types[cell.nature]
-        if cell.width > 1:
-            attrs[u"COLSPAN"] = str(cell.width)
-        if cell.height > 1:
-            attrs[u"ROWSPAN"] = str(cell.height)
+        # the box is read once: the cell position and sizes are properties of the box
+        cell_box = cell.box
+        cell_min = cell_box.min
+        cell_max = cell_box.max
+        width = cell_box.width
+        height = cell_box.height
+        attrs = {"COL": str(cell_min.x)}
+        cell_nature = cell.nature
+        if cell_nature and cell_nature != row.nature:
+            attrs["TYPE"] = _CELL_TYPE_VALUES[cell_nature]
+        if width > 1:
+            attrs[u"COLSPAN"] = str(width)
+        if height > 1:
+            attrs[u"ROWSPAN"] = str(height)
 
         # support for CALS-like elements and attributes
         if self.use_cals:
             cals = self.get_cals_qname
-            if cell.box.max.x != self._table.bounding_box.max.x:
+            get_style = cell_styles.get
+            if cell_max.x != self._table_max_x:
                 # generate @colsep if the cell isn't in the last column
                 cell_colsep = get_colsep_attr(cell_styles, "border-right")
                 if cell_colsep and cell_colsep != self._table_colsep:
                     attrs[cals("colsep")] = cell_colsep
-            if cell.box.max.y != self._table.bounding_box.max.y:
+            if cell_max.y != self._table_max_y:
                 # generate @rowsep if the cell isn't in the last row
                 cell_rowsep = get_rowsep_attr(cell_styles, "border-bottom")
                 if cell_rowsep and cell_rowsep != self._table_rowsep:
                     attrs[cals("rowsep")] = cell_rowsep
-            if "vertical-align" in cell_styles:
-                # same values as CSS/Properties/vertical-align
-                # 'w-both' is an extension of OoxmlParser
-                attrs[cals('valign')] = {
-                    'top': u'top',
-                    'middle': u'middle',
-                    'bottom': u'bottom',
-                    'baseline': u'bottom',
-                    'w-both': u'bottom',
-                }[cell_styles['vertical-align']]
-            if 'align' in cell_styles:
-                # same values as CSS/Properties/text-align
-            # fmt: off
-                attrs[cals('align')] = {
-                    'left': u'left',
-                    'center': u'center',
-                    'right': u'right',
-                    'justify': u'justify',
-                }[cell_styles['align']]
-            # fmt: on
-            if cell.width > 1:
-                attrs[cals("namest")] = u"c{0}".format(cell.box.min.x)
-                attrs[cals("nameend")] = u"c{0}".format(cell.box.max.x)
-            if cell.height > 1:
-                attrs[cals("morerows")] = str(cell.height - 1)
-            if "background-color" in cell_styles:
-                attrs[cals("bgcolor")] = cell_styles["background-color"]
+            valign = get_style("vertical-align")
+            if valign is not None:
+                attrs[cals('valign')] = _CELL_VALIGN_VALUES[valign]
+            align = get_style("align")
+            if align is not None:
+                attrs[cals('align')] = _ALIGN_VALUES[align]
+            if width > 1:
+                attrs[cals("namest")] = u"c{0}".format(cell_min.x)
+                attrs[cals("nameend")] = u"c{0}".format(cell_max.x)
+            if height > 1:
+                attrs[cals("morerows")] = str(height - 1)
+            bgcolor = get_style("background-color")
+            if bgcolor is not None:
+                attrs[cals("bgcolor")] = bgcolor
             # -- attribute @cals:cellstyle (extension)
-            if "cellstyle" in cell_styles:
+            cellstyle = get_style("cellstyle")
+            if cellstyle is not None:
                 # override the value set by the *nature*
-                attrs["TYPE"] = cell_styles["cellstyle"]
+                attrs["TYPE"] = cellstyle
 
         cell_elem = etree.SubElement(row_elem, u"CELL", attrib=attrs)
 
         # When a cell is empty, we need to insert the ``<IE/>`` tag.
-        is_empty_cell = cell.styles.get("x-cell-empty", "false") == "true"
         # We can also have an empty content if a short row is completed by empty cells.
-        if is_empty_cell or cell.content is None or cell.content == "":
+        content = cell.content
+        if cell_styles.get("x-cell-empty") == "true" or content is None or content == "":
             # The IE element is used to explicitly indicate
             # that specific structures have an empty content.
-            etree.strip_tags(cell_elem, "*")
+            # note: the cell element is newly created, so it has no child to strip.
             etree.SubElement(cell_elem, u"IE")
         else:
-            self.append_cell_elements(cell_elem, cell.content)
+            self.append_cell_elements(cell_elem, content)
 
     def finalize_tree(self, tree):
         """
@@ -666,17 +689,21 @@ class FormexBuilder(BaseBuilder):
         :type  fmx_root: ElementType
         :param fmx_root: The result tree which contains the ``TBL`` elements to update.
         """
-        context = iterwalk(fmx_root, events=("start",), tag=("TBL",))
+        context = iterwalk(fmx_root, events=("start", "end"), tag=("TBL",))
         stack = []
+        elem_level = 0  # number of ancestor-or-self TBL elements
         for action, elem in context:  # type: str, ElementType
-            elem_level = int(elem.xpath("count(ancestor-or-self::TBL)"))
+            if action == "end":
+                elem_level -= 1
+                continue
+            elem_level += 1
             curr_level = len(stack)
             if curr_level < elem_level:
                 stack.extend([0] * (elem_level - curr_level))
             else:
                 stack[:] = stack[:elem_level]
             stack[elem_level - 1] += 1
-            no_seq = u".".join(u"{:04d}".format(value) for value in stack)
+            no_seq = u".".join(map(u"{:04d}".format, stack))
             elem.attrib["NO.SEQ"] = no_seq
 
     # noinspection PyMethodMayBeStatic
@@ -687,12 +714,13 @@ class FormexBuilder(BaseBuilder):
         :type  fmx_root: ElementType
         :param fmx_root: The result tree which contains the ``TBL`` elements to remove.
         """
-        for fmx_tbl in fmx_root.xpath("//TBL"):  # type: ElementType
+        # the TBL elements are collected first, because the tree is modified
+        for fmx_tbl in list(fmx_root.iter("TBL")):  # type: ElementType
             fmx_parent = fmx_tbl.getparent()
             if fmx_parent is not None and fmx_parent.tag == "TBL":
                 # note that we cannot use etree.strip_tags() because a TBL may contains another TBL.
                 index = fmx_parent.index(fmx_tbl)
-                fmx_parent[index:index + 1] = fmx_tbl.getchildren()
+                fmx_parent[index:index + 1] = list(fmx_tbl)
 
     # noinspection PyPep8Naming
     def extract_gr_notes(self, fmx_root):
@@ -707,20 +735,23 @@ class FormexBuilder(BaseBuilder):
         .. versionchanged:: 0.5.1
            If the ROW contains a GR.NOTES, we move it before the CORPUS, else we create it.
         """
-        fmx = self.get_formex_qname
-        TBL = fmx("TBL").text
-        CORPUS = fmx("CORPUS").text
-        ROW = fmx("ROW").text
-        CELL = fmx("CELL").text
-        GR_NOTES = fmx("GR.NOTES").text
-        TYPE = fmx("TYPE").text
+        TBL = u"TBL"
+        CORPUS = u"CORPUS"
+        ROW = u"ROW"
+        CELL = u"CELL"
+        GR_NOTES = u"GR.NOTES"
+        TYPE = u"TYPE"
 
         for fmx_row in fmx_root.iter(ROW):
             row_type = fmx_row.attrib.pop(TYPE, None)
             if row_type and row_type == '__GR.NOTES__':
-                # Get the CORPUS index: the GR.NOTES will be inserted just before the CORPUS
-                fmx_tbl = next(fmx_row.iterancestors(TBL))
-                index = fmx_tbl.index(fmx_tbl.find(CORPUS))
+                # Get the CORPUS: the GR.NOTES will be inserted just before the (first) CORPUS
+                # (the rows are usually the children of TBL/CORPUS: no need to search the TBL)
+                fmx_parent = fmx_row.getparent()
+                fmx_tbl = fmx_parent.getparent()
+                if fmx_parent.tag != CORPUS or fmx_tbl is None or fmx_tbl.tag != TBL:
+                    fmx_tbl = next(fmx_row.iterancestors(TBL))
+                fmx_corpus = fmx_tbl.find(CORPUS)
 
                 # Find the first CELL of the ROW (there is only one CELL)
                 fmx_cell = fmx_row.find(CELL)
@@ -732,15 +763,17 @@ class FormexBuilder(BaseBuilder):
                     fmx_gr_notes = etree.Element(GR_NOTES)
                     fmx_gr_notes.text = cell_text
                     fmx_gr_notes.extend(fmx_cell[:])
-                    fmx_tbl.insert(index, fmx_gr_notes)
+                    fmx_corpus.addprevious(fmx_gr_notes)
                 else:
                     # moves the GR.NOTES (and the potential processing instructions)
-                    fmx_tbl[index:index] = fmx_cell[:]
-                    if index == 0:
+                    # the cell text goes after the node which precedes the CORPUS
+                    prev_node = fmx_corpus.getprevious()
+                    if prev_node is None:
                         fmx_tbl.text = (fmx_tbl.text or "") + cell_text
                     else:
-                        prev_node = fmx_tbl[index-1]
                         prev_node.tail = (prev_node.tail or "") + cell_text
+                    for fmx_node in fmx_cell[:]:
+                        fmx_corpus.addprevious(fmx_node)
 
                 # Add the CALS-like attributes
                 fmx_gr_notes.attrib.update((k, v) for k, v in fmx_row.attrib.items() if k not in fmx_gr_notes.attrib)
@@ -756,16 +789,25 @@ class FormexBuilder(BaseBuilder):
         :param fmx_root: The result tree which contains the ``CORPUS/ROW`` elements.
         """
         cals = self.get_cals_qname
-        for fmx_corpus in fmx_root.xpath("//CORPUS"):  # type: ElementType
+        rowstyle_attr = cals("rowstyle").text
+        namest_attr = cals("namest").text
+        nameend_attr = cals("nameend").text
+        # a document uses only a few row styles: parse each of them once
+        row_infos = {}
+        # the CORPUS elements are collected first, because the tree is modified
+        for fmx_corpus in list(fmx_root.iter("CORPUS")):  # type: ElementType
             stack = [fmx_corpus]
-            for fmx_row in fmx_corpus.getchildren():  # type: ElementType
+            # the children are collected first, because the rows are moved into the BLK elements
+            for fmx_row in fmx_corpus[:]:  # type: ElementType
                 if isinstance(fmx_row, ProcessingInstructionType):
                     # handle PIs (e.g.: revision marks)
                     fmx_top = stack[-1]
                     fmx_top.append(fmx_row)
                     continue
-                rowstyle = fmx_row.get(cals("rowstyle"))
-                row_info = guess_row_info(rowstyle)
+                rowstyle = fmx_row.get(rowstyle_attr)
+                row_info = row_infos.get(rowstyle)
+                if row_info is None:
+                    row_info = row_infos[rowstyle] = guess_row_info(rowstyle)
                 while len(stack) < row_info.level + 1:
                     fmx_top = stack[-1]
                     fmx_blk = etree.SubElement(fmx_top, "BLK")
@@ -776,31 +818,32 @@ class FormexBuilder(BaseBuilder):
                 if row_info.tag == "ROW":
                     if row_info.type is not None:
                         fmx_row.set("TYPE", row_info.type)
-                        for fmx_cell in fmx_row.xpath("CELL"):
+                        for fmx_cell in _CELL_XPATH(fmx_row):
                             fmx_cell.set("TYPE", row_info.type)
                     fmx_top.append(fmx_row)
                 elif row_info.tag in {"TI.BLK", "STI.BLK"}:
                     # get the COL.START/COL.END integer values (**required**)
                     # find the first non-empty cell (usually this is the first one).
-                    for col_pos, fmx_cell in enumerate(fmx_row.xpath("CELL"), 1):
-                        if fmx_cell.xpath("self::CELL[string() != '' or count(IE) != 0]"):
-                            name_start = fmx_cell.attrib.get(cals("namest"))
-                            name_end = fmx_cell.attrib.get(cals("nameend"))
+                    for col_pos, fmx_cell in enumerate(_CELL_XPATH(fmx_row), 1):
+                        # same as XPath: string() != '' or count(IE) != 0
+                        if fmx_cell.find("IE") is not None or any(fmx_cell.itertext()):
+                            name_start = fmx_cell.get(namest_attr)
+                            name_end = fmx_cell.get(nameend_attr)
                             if name_start and name_end:
-                                col_start = int(re.findall(r"\d+", name_start)[0])
-                                col_end = int(re.findall(r"\d+", name_end)[0])
+                                col_start = int(_COLNUM_REGEX.search(name_start).group())
+                                col_end = int(_COLNUM_REGEX.search(name_end).group())
                             else:
                                 col_start = col_end = col_pos
                             attrib = {"COL.START": text_type(col_start), "COL.END": text_type(col_end)}
                             break
                     else:
                         # unlikely to go here
-                        fmx_cell = fmx_row.xpath("CELL")[0]
+                        fmx_cell = _CELL_XPATH(fmx_row)[0]
                         attrib = {"COL.START": u"1", "COL.END": u"1"}
                     attrib.update({k: v for k, v in fmx_row.attrib.items() if k != "TYPE"})
                     fmx_title = etree.SubElement(fmx_top, row_info.tag, attrib=attrib)
                     fmx_title.text = fmx_cell.text
-                    fmx_title.extend(fmx_cell.getchildren())
+                    fmx_title.extend(fmx_cell[:])
                     fmx_corpus.remove(fmx_row)
                 else:  # pragma: no cover
                     raise NotImplementedError(row_info.tag)
@@ -819,17 +862,16 @@ class FormexBuilder(BaseBuilder):
         .. versionadded:: 0.5.1
         """
         cals = self.get_cals_qname
-        fmx = self.get_formex_qname
-        ROW = fmx("ROW").text
-        CELL = fmx("CELL").text
-        GR_NOTES = fmx("GR.NOTES").text
-        TI_BLK = fmx("TI.BLK").text
-        STI_BLK = fmx("STI.BLK").text
+        ROW = u"ROW"
+        CELL = u"CELL"
+        GR_NOTES = u"GR.NOTES"
+        TI_BLK = u"TI.BLK"
+        STI_BLK = u"STI.BLK"
         elements = {ROW, CELL, TI_BLK, STI_BLK, GR_NOTES}
-        for fmx_corpus in fmx_root.xpath("//TBL"):  # type: ElementType
-            context = iterwalk(fmx_corpus, events=("start",), tag=elements)
-            for action, elem in context:
-                elem.attrib.pop(cals("namest"), None)
-                elem.attrib.pop(cals("nameend"), None)
-                elem.attrib.pop(cals("morerows"), None)
-                elem.attrib.pop(cals("rowstyle"), None)
+        superfluous_attrs = {cals(name).text for name in ("namest", "nameend", "morerows", "rowstyle")}
+        for fmx_corpus in fmx_root.iter("TBL"):  # type: ElementType
+            for elem in fmx_corpus.iter(*elements):  # type: ElementType
+                attrib = elem.attrib
+                # only the existing attributes are removed (most elements have none of them)
+                for name in [name for name in attrib.keys() if name in superfluous_attrs]:
+                    del attrib[name]
@@ -125,7 +125,7 @@ class Grid(MutableMapping):
     """
     Collection of :class:`~benker.cell.Cell` objects ordered in a grid of rows and columns.
     """
-    __slots__ = ('_cells',)
+    __slots__ = ('_cells', '_boxes')
 
     def __init__(self, cells=None):
         """
@@ -139,7 +139,10 @@ class Grid(MutableMapping):
 
         :raises KeyError: if at least one cell intersect another one.
         """
+        # The cell boxes are stored in a parallel list (same order as the cells)
+        # to avoid dereferencing each cell when looking up coordinates.
         self._cells = []
+        self._boxes = []
         cells = cells or []
         for cell in cells:
             self.__setitem__(cell.min, cell)
@@ -148,34 +151,54 @@ class Grid(MutableMapping):
         cls = self.__class__.__name__
         return "{cls}({cells!r})".format(cls=cls, cells=self._cells)
 
+    def _rows_end(self, row_pos):
+        # The boxes are sorted by rows first: the boxes which start after
+        # the row *row_pos* cannot contain/intersect this row.
+        if row_pos < 1:
+            return 0
+        return bisect.bisect_left(self._boxes, Box(1, row_pos + 1))
+
+    def _find_index(self, coord):
+        boxes = self._boxes
+        for index in range(self._rows_end(coord.y)):
+            if coord in boxes[index]:
+                return index
+        return -1
+
+    def _insert_cell(self, new_cell):
+        new_box = new_cell.box
+        index = bisect.bisect_left(self._boxes, Box(new_box.min))
+        self._cells.insert(index, new_cell)
+        self._boxes.insert(index, new_box)
+
     def __contains__(self, coord):
         coord = Coord.from_value(coord)
-        return any(coord in cell for cell in self._cells)
+        boxes = itertools.islice(self._boxes, self._rows_end(coord.y))
+        return any(map(operator.contains, boxes, itertools.repeat(coord)))
 
     def __getitem__(self, coord):
         coord = Coord.from_value(coord)
-        for cell in self._cells:
-            if coord in cell:
-                return cell
-        raise KeyError(coord)
+        index = self._find_index(coord)
+        if index == -1:
+            raise KeyError(coord)
+        return self._cells[index]
 
     def __delitem__(self, coord):
         coord = Coord.from_value(coord)
-        for cell in self._cells[:]:
-            if coord in cell:
-                self._cells.remove(cell)
-                return
-        raise KeyError(coord)
+        index = self._find_index(coord)
+        if index == -1:
+            raise KeyError(coord)
+        del self._cells[index]
+        del self._boxes[index]
 
     def __setitem__(self, coord, new_cell):
         coord = Coord.from_value(coord)  # type: Coord
         new_cell = new_cell.move_to(coord)
-        for cell in self._cells[:]:
-            if cell.box.intersect(new_cell.box):
-                raise KeyError(coord)
-        boxes = [cell.box for cell in self._cells]
-        index = bisect.bisect_left(boxes, Box(new_cell.box.min))
-        self._cells.insert(index, new_cell)
+        new_box = new_cell.box
+        boxes = itertools.islice(self._boxes, self._rows_end(new_box.max.y))
+        if any(map(new_box.intersect, boxes)):
+            raise KeyError(coord)
+        self._insert_cell(new_cell)
 
     def __len__(self):
         return len(self._cells)
@@ -189,8 +212,8 @@ class Grid(MutableMapping):
     @property
     def bounding_box(self):
         """ Bounding box of the grid (``None`` if the grid is empty). """
-        if len(self):
-            boxes = [cell.box for cell in self._cells]
+        boxes = self._boxes
+        if boxes:
             bounding_box = boxes[0].union(*boxes[1:])
             return bounding_box
         return None
@@ -235,13 +258,15 @@ class Grid(MutableMapping):
         new_box = Box(start_coord, end_coord)
         merged_cells = []
         unchanged_cells = []
-        for cell in self._cells:
-            if cell.box in new_box:
+        unchanged_boxes = []
+        for cell, box in zip(self._cells, self._boxes):
+            if box in new_box:
                 merged_cells.append(cell)
-            elif cell.box.intersect(new_box):
+            elif box.intersect(new_box):
                 raise ValueError((start, end))
             else:
                 unchanged_cells.append(cell)
+                unchanged_boxes.append(box)
         if not merged_cells:
             # nothing to merge
             raise ValueError((start, end))
@@ -256,9 +281,8 @@ class Grid(MutableMapping):
                 new_cell.content = content_appender(new_cell.content, cell.content)
             new_cell.styles.update(cell.styles)
         self._cells = unchanged_cells
-        boxes = [cell.box for cell in self._cells]
-        index = bisect.bisect_left(boxes, Box(new_cell.box.min))
-        self._cells.insert(index, new_cell)
+        self._boxes = unchanged_boxes
+        self._insert_cell(new_cell)
         return new_cell
 
     def expand(self, coord, width=0, height=0, content_appender=None):
@@ -298,5 +322,5 @@ class Grid(MutableMapping):
     def iter_rows(self):
         """ Iterate the cells grouped by rows. """
         cells = self._cells
-        for group, cells in itertools.groupby(cells, key=lambda c: c.min.y):
+        for group, cells in itertools.groupby(cells, key=operator.attrgetter("min.y")):
             yield tuple(cells)
@@ -115,6 +115,6 @@ class Size(SizeTuple):
         value_type = type(value)
         if value_type is cls:
             return value
-        elif value_type is tuple and tuple(map(type, value)) == (int, int):
+        elif value_type is tuple and len(value) == 2 and type(value[0]) is int and type(value[1]) is int:
             return cls(*value)
         raise TypeError(repr(value_type))
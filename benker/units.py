@@ -20,6 +20,9 @@ UNITS = {
     'pc': 0.001 * 25.4 / 12,
 }
 
+#: Regex used to parse a width: a value and an optional unit
+_WIDTH_REGEX = re.compile(r"([+-]?(?:[0-9]*[.])?[0-9]+)(cm|dm|ft|in|mm|pc|pt|px|m)?")
+
 
 def convert_value(value, unit_in, unit_out):
     """
@@ -64,14 +67,26 @@ def parse_width(width, default_unit="mm"):
         >>> parse_width("210pt")
         (210.0, 'pt')
 
+        >>> parse_width("auto")
+        Traceback (most recent call last):
+            ...
+        ValueError: auto
+
     :param width: width string to parse, for instance: "247mm".
     :param default_unit: default unit to use if it is not specified
 
     :rtype: (float, str)
     :return: the value and its unit.
 
+    :raises ValueError: if the width cannot be parsed.
+
     .. versionadded:: 0.5.1
+
+    .. versionchanged:: 0.5.5
+       Raise :class:`ValueError` instead of :class:`IndexError` if the width cannot be parsed.
     """
-    width, unit = re.findall(r"([+-]?(?:[0-9]*[.])?[0-9]+)(cm|dm|ft|in|mm|pc|pt|px|m)?", width)[0]
-    unit = unit or default_unit
-    return float(width), unit
+    match = _WIDTH_REGEX.search(width)
+    if match is None:
+        raise ValueError(width)
+    value, unit = match.groups()
+    return float(value), unit or default_unit
@@ -1,6 +1,7 @@
 # coding: utf-8
 from __future__ import print_function
 
+import collections
 import sys
 import unittest
 
@@ -9,6 +10,9 @@ import xmldiff.main
 from lxml import etree
 
 from benker.builders.cals import CalsBuilder
+from benker.builders.cals import format_width
+from benker.builders.cals import get_frame_attr
+from benker.builders.cals import revision_mark
 from benker.cell import Cell
 from benker.table import Table
 
@@ -57,11 +61,57 @@ class TestCalsBuilder(unittest.TestCase):
             CalsBuilder(tgroup_sorting=["header", "body"])
 
 
+@pytest.mark.parametrize(
+    "styles, expected",
+    [
+        ({}, u"none"),
+        ({"border-top": "solid 1.0pt #000000"}, u"top"),
+        ({"border-bottom": "double 0.5pt auto"}, u"bottom"),
+        ({"border-top": "solid", "border-bottom": "solid"}, u"topbot"),
+        ({"border-left": "solid", "border-right": "dashed"}, u"sides"),
+        ({"border-top": "solid", "border-bottom": "solid", "border-left": "solid", "border-right": "solid"}, u"all"),
+        ({"border-top": "none", "border-bottom": "solid", "border-left": "solid", "border-right": "solid"}, u"none"),
+        ({"border-top": "1.0pt #000000"}, u"none"),
+    ],
+)
+def test_get_frame_attr(styles, expected):
+    assert get_frame_attr(styles) == expected
+
+
+@pytest.mark.parametrize(
+    "width, width_unit, expected",
+    [
+        ("1.5cm", "mm", u"15.00mm"),
+        ("72pt", "in", u"1.00in"),
+        ("210", "mm", u"210.00mm"),
+    ],
+)
+def test_format_width(width, width_unit, expected):
+    assert format_width(width, width_unit) == expected
+
+
+def test_format_width__cached():
+    # the second call returns the memoized value
+    assert format_width("1.5cm", "mm") == format_width("1.5cm", "mm") == u"15.00mm"
+
+
+def test_revision_mark():
+    attrs = collections.OrderedDict([("type", "row:insertion"), ("creator", u'A&B <"Team">\n')])
+    rev_pi = revision_mark("change-start", attrs)
+    expected = u'<?change-start type="row:insertion" creator="A&amp;B &lt;&quot;Team&quot;&gt;&#10;"?>'
+    assert etree.tounicode(rev_pi) == expected
+
+
 def test_setup_table():
     builder = CalsBuilder()
     table = Table()
     result = builder.setup_table(table)
     assert result == table
+    assert (builder._table_max_x, builder._table_max_y) == (0, 0)
+
+    table = Table([Cell("a", x=1, y=1), Cell("b", x=2, y=1, height=3)])
+    builder.setup_table(table)
+    assert (builder._table_max_x, builder._table_max_y) == (2, 3)
 
 
 TEST_DATA__WITH_SEP = [
@@ -254,6 +304,25 @@ def test_build_cell__align(cell_styles, expected):
     assert entry_elem[0] == p_elem
 
 
+def test_build_cell__independent_attrs():
+    # -- create a minimal <row> element
+    row_elem = etree.XML("<row/>")
+
+    # -- setup a table with two styled cells
+    cell_x1_y1 = Cell(u"a", x=1, y=1, styles={"align": "center"})
+    cell_x2_y1 = Cell(u"b", x=2, y=1, styles={"background-color": "#FF0000"})
+
+    # -- build the cells
+    builder = CalsBuilder()
+    builder.setup_table(Table([cell_x1_y1, cell_x2_y1]))
+    builder.build_cell(row_elem, cell_x1_y1)
+    builder.build_cell(row_elem, cell_x2_y1)
+
+    # -- each '<entry>' has its own attributes
+    assert dict(row_elem[0].attrib) == {"align": "center"}
+    assert dict(row_elem[1].attrib) == {"bgcolor": "#FF0000"}
+
+
 @pytest.mark.parametrize(
     "tgroup_sorting, expected_tags",
     [
@@ -287,6 +356,41 @@ def test_build_tgroup__tgroup_sorting(tgroup_sorting, expected_tags):
     assert actual_tags == expected_tags
 
 
+def test_build_tgroup__interleaved_natures():
+    # -- create a table with non-contiguous rows of the same nature
+    table = Table()
+    for pos, nature in enumerate(["header", "body", "header", None, "body"], 1):
+        table.rows[pos].nature = nature
+        table.rows[pos].insert_cell(u"r{0}".format(pos))
+
+    # -- create a builder
+    table_elem = etree.Element("table")
+    builder = CalsBuilder()
+    builder.setup_table(table)
+    builder.build_tgroup(table_elem, table)
+
+    # -- check the tgroup children name and the rows contents
+    actual_tags = [elem.tag for elem in table_elem.xpath("tgroup/*")]
+    assert actual_tags == ["colspec", "thead", "tbody"]
+    assert table_elem.xpath("tgroup/thead/row/entry/text()") == ["r1", "r3"]
+    assert table_elem.xpath("tgroup/tbody/row/entry/text()") == ["r2", "r4", "r5"]
+
+
+def test_build_table__namespace_declared_once():
+    table = Table()
+    table.rows[1].insert_cell(u"a", styles={"align": "center"})
+    table.rows[1].insert_cell(u"b")
+    table.rows[2].insert_cell(u"c", width=2)
+
+    builder = CalsBuilder(cals_ns="http://cals", cals_prefix="cals")
+    table_elem = builder.build_table(table)
+
+    xml = etree.tounicode(table_elem)
+    assert xml.count(u'xmlns:cals="http://cals"') == 1
+    assert xml.startswith(u'<cals:table xmlns:cals="http://cals"')
+    assert len(table_elem.xpath("//cals:entry", namespaces={"cals": "http://cals"})) == 3
+
+
 def test_build_table():
     # see: formex-4/samples/jo-compl-2002C_061/C_2002061EN.01000403.xml
 
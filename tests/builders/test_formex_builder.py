@@ -134,6 +134,36 @@ def test_build_title():
         assert diff_list == []
 
 
+def test_build_title__paragraphs():
+    table = Table()
+    table.rows[1].insert_cell([P(u"Title"), P(u"Sub-title"), P(u"Note")], styles={"align": "center"})
+
+    builder = FormexBuilder()
+    tbl_elem = TBL()
+    builder.build_title(tbl_elem, table.rows[0])
+
+    # -- check the '<TITLE>' content
+    title_elem = tbl_elem[0]  # type: etree._Element
+    xml_parser = etree.XMLParser(remove_blank_text=True)
+    # fmt: off
+    expected = etree.XML(u"""\
+    <TITLE>
+      <TI>
+        <P>Title</P>
+      </TI>
+      <STI>
+        <P>Sub-title</P>
+        <P>Note</P>
+      </STI>
+    </TITLE>""", parser=xml_parser)
+    # fmt: on
+
+    diff_list = xmldiff.main.diff_trees(title_elem, expected)
+    if diff_list:
+        print(etree.tounicode(title_elem, pretty_print=True, with_tail=False), file=sys.stderr)
+        assert diff_list == []
+
+
 def test_build_title__empty():
     table = Table()
     table.rows[1].insert_cell(None, styles={"align": "center"})
@@ -454,3 +484,89 @@ def test_build_tbl__use_cals():
     if diff_list:
         print(etree.tounicode(table_elem, pretty_print=True, with_tail=False), file=sys.stderr)
         assert diff_list == []
+
+
+def test_update_no_seq():
+    # fmt: off
+    fmx_root = E.DOC(
+        E.TBL(E.CORPUS(E.ROW(E.CELL(E.TBL(), E.TBL(E.TBL()))))),
+        E.P(E.TBL(E.TBL())),
+    )
+    # fmt: on
+    builder = FormexBuilder()
+    builder.update_no_seq(fmx_root)
+    actual = [elem.get("NO.SEQ") for elem in fmx_root.iter("TBL")]
+    assert actual == ["0001", "0001.0001", "0001.0002", "0001.0002.0001", "0002", "0002.0001"]
+
+
+def test_extract_gr_notes():
+    # fmt: off
+    fmx_root = E.DOC(
+        E.TBL(
+            E.CORPUS(
+                E.ROW(E.CELL(E.P("body"))),
+                E.ROW(E.CELL(E.P("note")), TYPE="__GR.NOTES__"),
+            ),
+        ),
+    )
+    # fmt: on
+    builder = FormexBuilder()
+    builder.extract_gr_notes(fmx_root)
+    fmx_tbl = fmx_root[0]
+    assert [elem.tag for elem in fmx_tbl] == ["GR.NOTES", "CORPUS"]
+    assert [elem.text for elem in fmx_tbl[0]] == ["note"]
+    assert len(fmx_tbl.find("CORPUS")) == 1
+
+
+@pytest.mark.parametrize(
+    "cells, expected",
+    [
+        ([E.CELL(), E.CELL(E.P(u"Title"))], {"COL.START": u"2", "COL.END": u"2"}),
+        ([E.CELL(), E.CELL(E.IE())], {"COL.START": u"2", "COL.END": u"2"}),
+        ([E.CELL(u" "), E.CELL(E.P(u"Title"))], {"COL.START": u"1", "COL.END": u"1"}),
+    ],
+)
+def test_insert_blk__ti_blk(cells, expected):
+    builder = FormexBuilder(use_cals=True)
+    rowstyle = builder.get_cals_qname("rowstyle").text
+    fmx_root = E.TBL(E.CORPUS(E.ROW(*cells, **{rowstyle: u"TI.BLK"})))
+    builder.insert_blk(fmx_root)
+    fmx_title = fmx_root.find("CORPUS/TI.BLK")
+    assert {k: fmx_title.get(k) for k in expected} == expected
+
+
+def test_extract_gr_notes__existing():
+    fmx_cell = etree.XML(u'<CELL>\n<?pi data?>\n<GR.NOTES><NOTE/></GR.NOTES>\n</CELL>')
+    # fmt: off
+    fmx_root = E.DOC(
+        E.TBL(
+            E.TITLE(),
+            E.CORPUS(E.ROW(fmx_cell, TYPE="__GR.NOTES__")),
+        ),
+    )
+    # fmt: on
+    builder = FormexBuilder()
+    builder.extract_gr_notes(fmx_root)
+    actual = etree.tounicode(fmx_root)
+    expected = u'<DOC><TBL><TITLE/>\n<?pi data?>\n<GR.NOTES><NOTE/></GR.NOTES>\n<CORPUS/></TBL></DOC>'
+    assert actual == expected
+
+
+def test_extract_gr_notes__two_corpus():
+    # a flattened TBL may contain several CORPUS: the GR.NOTES goes before the first one
+    # fmt: off
+    fmx_root = E.DOC(
+        E.TBL(
+            E.CORPUS(E.ROW(E.CELL(E.P("body 1")))),
+            E.CORPUS(
+                E.ROW(E.CELL(E.P("body 2"))),
+                E.ROW(E.CELL(E.P("note")), TYPE="__GR.NOTES__"),
+            ),
+        ),
+    )
+    # fmt: on
+    builder = FormexBuilder()
+    builder.extract_gr_notes(fmx_root)
+    fmx_tbl = fmx_root[0]
+    assert [elem.tag for elem in fmx_tbl] == ["GR.NOTES", "CORPUS", "CORPUS"]
+    assert [len(elem) for elem in fmx_tbl] == [1, 1, 1]
@@ -0,0 +1,69 @@
+# coding: utf-8
+try:
+    from string import uppercase as ascii_uppercase
+except ImportError:
+    from string import ascii_uppercase
+
+import pytest
+
+import benker.alphabet
+from benker.alphabet import alphabet_to_int
+from benker.alphabet import int_to_alphabet
+
+
+@pytest.mark.parametrize(
+    "letters, alphabet, expected",
+    [
+        (u"AB", u"ABC", 5),
+        (u"AB", list(u"ABC"), 5),
+        (u"AB", tuple(u"ABC"), 5),
+    ],
+)
+def test_alphabet_to_int__alphabet_type(letters, alphabet, expected):
+    assert alphabet_to_int(letters, alphabet) == expected
+
+
+def test_alphabet_to_int__letters_type():
+    assert alphabet_to_int(list("AB")) == 28
+    assert alphabet_to_int(tuple("ZZ")) == 702
+
+
+@pytest.mark.parametrize(
+    "value, letters",
+    [
+        (1, "A"),
+        (26, "Z"),
+        (27, "AA"),
+        (702, "ZZ"),
+        (703, "AAA"),
+        (18278, "ZZZ"),
+        (18279, "AAAA"),
+    ],
+)
+def test_int_to_alphabet__boundaries(value, letters):
+    assert int_to_alphabet(value) == letters
+    assert alphabet_to_int(letters) == value
+    # a custom alphabet uses the same algorithm, without cache
+    assert int_to_alphabet(value, alphabet=list(ascii_uppercase)) == letters
+
+
+def test_int_to_alphabet__cache_hit():
+    first = int_to_alphabet(12345)
+    assert 12345 in benker.alphabet._INT_TO_ALPHABET_CACHE
+    assert int_to_alphabet(12345) == first == "RFU"
+    first = alphabet_to_int("RFU")
+    assert "RFU" in benker.alphabet._ALPHABET_TO_INT_CACHE
+    assert alphabet_to_int("RFU") == first == 12345
+
+
+def test_int_to_alphabet__cache_eviction():
+    maxsize = benker.alphabet._CACHE_MAXSIZE
+    for value in range(1, maxsize * 2 + 1):
+        letters = int_to_alphabet(value)
+        assert alphabet_to_int(letters) == value
+        assert len(benker.alphabet._INT_TO_ALPHABET_CACHE) <= maxsize
+        assert len(benker.alphabet._ALPHABET_TO_INT_CACHE) <= maxsize
+    # the values are still correct after the cache has been cleared
+    assert int_to_alphabet(1) == "A"
+    assert int_to_alphabet(maxsize * 2) == "LCB"
+    assert alphabet_to_int("LCB") == maxsize * 2
@@ -0,0 +1,86 @@
+# coding: utf-8
+import pickle
+import sys
+
+import pytest
+
+from benker.box import Box
+from benker.coord import Coord
+
+
+@pytest.mark.parametrize(
+    "box1, box2",
+    [
+        (Box(3, 2, 6, 4), Box(3, 2, 6, 5)),
+        (Box(3, 2, 6, 4), Box(3, 2, 7, 4)),
+        (Box(3, 2, 6, 4), Box(4, 2, 6, 4)),
+        (Box(3, 2, 6, 4), Box(3, 3, 6, 4)),
+        # rows first: a box of the first row is lower than a box of the second row
+        (Box(5, 1, 5, 1), Box(1, 2, 1, 2)),
+    ],
+)
+def test_ordering(box1, box2):
+    assert box1 < box2
+    assert box1 <= box2
+    assert box2 > box1
+    assert box2 >= box1
+    assert not box1 > box2
+    assert not box1 >= box2
+    assert box1 <= box1 and box1 >= box1
+
+
+def test_ordering__sorted():
+    boxes = [Box(1, 2), Box(2, 1), Box(1, 1, 2, 1), Box(1, 1)]
+    assert sorted(boxes) == [Box(1, 1), Box(1, 1, 2, 1), Box(2, 1), Box(1, 2)]
+
+
+@pytest.mark.skipif(sys.version_info < (3,), reason="Python 2 can compare any objects")
+def test_ordering__tuple():
+    with pytest.raises(TypeError):
+        Box(1, 1) < (Coord(1, 1), Coord(1, 1))
+
+
+def test_equality():
+    assert Box(1, 2, 3, 4) == Box(Coord(1, 2), Coord(3, 4))
+    assert Box(1, 2, 3, 4) != Box(1, 2, 3, 5)
+    assert not Box(1, 2, 3, 4) != Box(1, 2, 3, 4)
+
+
+def test_equality__tuple():
+    # a Box is no longer a tuple
+    box = Box(1, 2, 3, 4)
+    assert box != (Coord(1, 2), Coord(3, 4))
+    assert not box == (Coord(1, 2), Coord(3, 4))
+    # but it can still be unpacked
+    min_coord, max_coord = box
+    assert (min_coord, max_coord) == (Coord(1, 2), Coord(3, 4))
+
+
+def test_hash():
+    assert hash(Box(1, 2, 3, 4)) == hash(Box(Coord(1, 2), Coord(3, 4)))
+    assert len({Box(1, 2, 3, 4), Box(1, 2, 3, 4), Box(1, 1)}) == 2
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    box = Box(1, 2, 3, 4)
+    copy = pickle.loads(pickle.dumps(box, protocol=protocol))
+    assert type(copy) is Box
+    assert copy == box
+    assert (copy.width, copy.height) == (3, 3)
+
+
+def test_setattr():
+    box = Box(1, 2, 3, 4)
+    with pytest.raises(AttributeError):
+        box.min = Coord(2, 2)
+    with pytest.raises(AttributeError):
+        box.foo = 1
+    assert box == Box(1, 2, 3, 4)
+
+
+def test_delattr():
+    box = Box(1, 2, 3, 4)
+    with pytest.raises(AttributeError):
+        del box.min
+    assert box.min == Coord(1, 2)
@@ -0,0 +1,114 @@
+# coding: utf-8
+import random
+
+import pytest
+
+from benker.cell import Cell
+from benker.coord import Coord
+from benker.grid import Grid
+
+
+def check_invariant(grid):
+    # the boxes are stored in a parallel list, sorted like the cells
+    boxes = [cell.box for cell in grid]
+    assert grid._boxes == boxes
+    assert boxes == sorted(boxes)
+
+
+def test_getitem__across_rows():
+    # fmt: off
+    grid = Grid([
+        Cell("a", x=1, y=1, height=3), Cell("b", x=2, y=1, width=2),
+        Cell("c", x=2, y=2), Cell("d", x=3, y=2, height=2),
+        Cell("e", x=2, y=3),
+    ])
+    # fmt: on
+    check_invariant(grid)
+    # the cell "a" starts in the first row, but is found in the next rows
+    assert grid[1, 1].content == "a"
+    assert grid[1, 2].content == "a"
+    assert grid[1, 3].content == "a"
+    assert grid[3, 1].content == "b"
+    assert grid[3, 3].content == "d"
+    assert (1, 3) in grid
+    assert (3, 3) in grid
+    assert (1, 4) not in grid
+    assert (4, 1) not in grid
+    with pytest.raises(KeyError):
+        grid[1, 4]
+
+
+def test_setitem__multi_row_cell():
+    grid = Grid()
+    grid[2, 1] = Cell("b")
+    grid[1, 1] = Cell("a", height=3)
+    grid[2, 3] = Cell("c")
+    check_invariant(grid)
+    assert [cell.content for cell in grid] == ["a", "b", "c"]
+    assert grid[1, 3].content == "a"
+    # the new cell intersects the cell "a" (in a row below its starting row)
+    with pytest.raises(KeyError):
+        grid[1, 2] = Cell("x")
+    with pytest.raises(KeyError):
+        grid[2, 2] = Cell("x", width=1, height=2)
+    check_invariant(grid)
+
+
+def test_merge():
+    # fmt: off
+    grid = Grid([
+        Cell("a", x=1, y=1), Cell("b", x=2, y=1),
+        Cell("c", x=1, y=2), Cell("d", x=2, y=2),
+        Cell("e", x=1, y=3), Cell("f", x=2, y=3),
+    ])
+    # fmt: on
+    merged = grid.merge((1, 2), (2, 3), content_appender=lambda a, b: a + b)
+    check_invariant(grid)
+    assert merged.content == "cdef"
+    assert grid[2, 3] is merged
+    assert grid[1, 1].content == "a"
+    assert len(grid) == 3
+
+
+def test_delitem__then_getitem():
+    # fmt: off
+    grid = Grid([
+        Cell("a", x=1, y=1, height=2), Cell("b", x=2, y=1),
+        Cell("c", x=2, y=2),
+    ])
+    # fmt: on
+    del grid[1, 2]  # any coord of the cell
+    check_invariant(grid)
+    assert (1, 1) not in grid
+    with pytest.raises(KeyError):
+        grid[1, 2]
+    with pytest.raises(KeyError):
+        del grid[1, 2]
+    assert grid[2, 2].content == "c"
+    grid[1, 2] = Cell("x")
+    check_invariant(grid)
+    assert grid[1, 2].content == "x"
+
+
+def test_random_operations():
+    # compare the lookups with a brute-force search
+    rnd = random.Random(42)
+    grid = Grid()
+    for _ in range(500):
+        x, y = rnd.randint(1, 6), rnd.randint(1, 6)
+        action = rnd.choice(["insert", "insert", "delete", "merge"])
+        try:
+            if action == "insert":
+                grid[x, y] = Cell("x", width=rnd.randint(1, 2), height=rnd.randint(1, 3))
+            elif action == "delete":
+                del grid[x, y]
+            else:
+                grid.merge((x, y), (x + rnd.randint(0, 1), y + rnd.randint(0, 1)))
+        except (KeyError, ValueError):
+            pass
+        check_invariant(grid)
+        for coord in (Coord(i, j) for i in range(1, 9) for j in range(1, 11)):
+            expected = [cell for cell in grid if coord in cell.box]
+            assert (coord in grid) == bool(expected)
+            if expected:
+                assert grid[coord] is expected[0]